@@ -5,17 +5,35 @@ SAFETY NOTE: Safety-critical constants are imported from common/constants.py
 and cannot be overridden via environment variables.
 """
 import os
-import sys
 
-# Add parent to path for common imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from common.constants import (
     WATCHDOG_TIMEOUT_S, RECONNECT_DELAY_S,
     DEFAULT_CONTROL_PORT, DEFAULT_VIDEO_PORT, DEFAULT_TELEMETRY_PORT
 )
 
+# Environment is read once at import; changes made after import are ignored.
+_E = os.environ
+
+
+def _b(key: str, default: str) -> bool:
+    """Read a 'true'/'false' environment flag."""
+    return _E.get(key, default).lower() == 'true'
+
+
+def _i(key: str, default: int) -> int:
+    """Read an integer environment value."""
+    value = _E.get(key)
+    return default if value is None else int(value)
+
+
+def _f(key: str, default: float) -> float:
+    """Read a float environment value."""
+    value = _E.get(key)
+    return default if value is None else float(value)
+
+
 # Simulation mode - enables testing without hardware
-SIM_MODE = os.getenv('SIM_MODE', 'false').lower() == 'true'
+SIM_MODE = _b('SIM_MODE', 'false')
 
 # ============================================================================
 # NETWORK CONFIGURATION - VERIFY FOR YOUR DEPLOYMENT
@@ -26,47 +44,67 @@ SIM_MODE = os.getenv('SIM_MODE', 'false').lower() == 'true'
 #   - Update ROBOT_PI_IP if needed
 #   - Git history shows subnet was changed from 192.168.100.x to 192.168.1.x
 # ============================================================================
-ROBOT_PI_IP = os.getenv('ROBOT_PI_IP', '192.168.1.20')
-CONTROL_PORT = int(os.getenv('CONTROL_PORT', str(DEFAULT_CONTROL_PORT)))
-VIDEO_PORT = int(os.getenv('VIDEO_PORT', str(DEFAULT_VIDEO_PORT)))
-TELEMETRY_PORT = int(os.getenv('TELEMETRY_PORT', str(DEFAULT_TELEMETRY_PORT)))
+ROBOT_PI_IP = _E.get('ROBOT_PI_IP', '192.168.1.20')
+CONTROL_PORT = _i('CONTROL_PORT', DEFAULT_CONTROL_PORT)
+VIDEO_PORT = _i('VIDEO_PORT', DEFAULT_VIDEO_PORT)
+TELEMETRY_PORT = _i('TELEMETRY_PORT', DEFAULT_TELEMETRY_PORT)
 
 # Serpent Backend Integration
-BACKEND_URL = os.getenv('BACKEND_URL', 'http://localhost:5000')
-BACKEND_SOCKETIO_URL = os.getenv('BACKEND_SOCKETIO_URL', 'http://localhost:5000')
+BACKEND_URL = _E.get('BACKEND_URL', 'http://localhost:5000')
+BACKEND_SOCKETIO_URL = _E.get('BACKEND_SOCKETIO_URL', 'http://localhost:5000')
+# Telemetry to backend is buffered and flushed every TELEMETRY_EMIT_INTERVAL_S.
+# TELEMETRY_EMIT_BATCHED sends one 'telemetry_batch' (list) event per flush;
+# leave off unless the backend handles that event.
+TELEMETRY_EMIT_INTERVAL_S = _f('TELEMETRY_EMIT_INTERVAL', 0.1)
+TELEMETRY_EMIT_BATCHED = _b('TELEMETRY_EMIT_BATCHED', 'false')
+# TELEMETRY_EMIT_MSGPACK sends telemetry as msgpack bytes on 'telemetry_mp' /
+# 'telemetry_batch_mp' / 'controller_telemetry_mp' (backend must handle them).
+TELEMETRY_EMIT_MSGPACK = _b('TELEMETRY_EMIT_MSGPACK', 'false')
+# TELEMETRY_EMIT_LATEST_ONLY sends only the newest sample per flush (backend sees
+# at most 1/TELEMETRY_EMIT_INTERVAL_S samples/s; the rest are dropped).
+TELEMETRY_EMIT_LATEST_ONLY = _b('TELEMETRY_EMIT_LATEST_ONLY', 'false')
+# TELEMETRY_PUB_PORT > 0 publishes telemetry on a ZeroMQ PUB socket instead of
+# Socket.IO 'telemetry' events (backend subscribes; needs pyzmq). 0 = disabled.
+TELEMETRY_PUB_PORT = _i('TELEMETRY_PUB_PORT', 0)
+TELEMETRY_PUB_HWM = _i('TELEMETRY_PUB_HWM', 1000)
 
 # Video Configuration
-VIDEO_BUFFER_SIZE = int(os.getenv('VIDEO_BUFFER_SIZE', '65536'))
-VIDEO_ENABLED = os.getenv('VIDEO_ENABLED', 'true').lower() == 'true'
+VIDEO_BUFFER_SIZE = _i('VIDEO_BUFFER_SIZE', 65536)
+VIDEO_ENABLED = _b('VIDEO_ENABLED', 'true')
 
 # Video HTTP Server (for MJPEG streaming to backend/frontend)
-VIDEO_HTTP_ENABLED = os.getenv('VIDEO_HTTP_ENABLED', 'true').lower() == 'true'
-VIDEO_HTTP_PORT = int(os.getenv('VIDEO_HTTP_PORT', '5004'))
+VIDEO_HTTP_ENABLED = _b('VIDEO_HTTP_ENABLED', 'true')
+VIDEO_HTTP_PORT = _i('VIDEO_HTTP_PORT', 5004)
 
 # Safety Configuration - IMMUTABLE (from common/constants.py)
 WATCHDOG_TIMEOUT = WATCHDOG_TIMEOUT_S  # 5.0 seconds - DO NOT CHANGE
 RECONNECT_DELAY = RECONNECT_DELAY_S    # 2.0 seconds
-MAX_RECONNECT_ATTEMPTS = int(os.getenv('MAX_RECONNECT_ATTEMPTS', '0'))  # 0 = infinite
+MAX_RECONNECT_ATTEMPTS = _i('MAX_RECONNECT_ATTEMPTS', 0)  # 0 = infinite
 
 # Logging Configuration
-LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-LOG_FILE = os.getenv('LOG_FILE', '/var/log/serpent/base_pi_bridge.log')
+LOG_LEVEL = _E.get('LOG_LEVEL', 'INFO')
+LOG_FILE = _E.get('LOG_FILE', '/var/log/serpent/base_pi_bridge.log')
 
 # Camera Configuration
-NUM_CAMERAS = int(os.getenv('NUM_CAMERAS', '3'))
-DEFAULT_CAMERA_ID = int(os.getenv('DEFAULT_CAMERA_ID', '0'))
+NUM_CAMERAS = _i('NUM_CAMERAS', 3)
+DEFAULT_CAMERA_ID = _i('DEFAULT_CAMERA_ID', 0)
 
 # Dashboard Configuration
-DASHBOARD_ENABLED = os.getenv('DASHBOARD_ENABLED', 'true').lower() == 'true'
-DASHBOARD_WS_PORT = int(os.getenv('DASHBOARD_WS_PORT', '5005'))
-TELEMETRY_BUFFER_SIZE = int(os.getenv('TELEMETRY_BUFFER_SIZE', '600'))
+DASHBOARD_ENABLED = _b('DASHBOARD_ENABLED', 'true')
+DASHBOARD_WS_PORT = _i('DASHBOARD_WS_PORT', 5005)
+TELEMETRY_BUFFER_SIZE = _i('TELEMETRY_BUFFER_SIZE', 600)
 
 # Storage Configuration (SSD)
 # Note: Video recording moved to separate project: ~/serpent-video-recorder
-STORAGE_ENABLED = os.getenv('STORAGE_ENABLED', 'true').lower() == 'true'  # Enabled by default
-STORAGE_BASE_PATH = os.getenv('STORAGE_BASE_PATH', '/media/serpentbase/SSK_SSD/serpent_recordings')
-TELEMETRY_RETENTION_DAYS = int(os.getenv('TELEMETRY_RETENTION_DAYS', '3650'))  # ~10 years (no auto-delete)
-COMMAND_RETENTION_DAYS = int(os.getenv('COMMAND_RETENTION_DAYS', '3650'))  # ~10 years (no auto-delete)
+STORAGE_ENABLED = _b('STORAGE_ENABLED', 'true')  # Enabled by default
+STORAGE_BASE_PATH = _E.get('STORAGE_BASE_PATH', '/media/serpentbase/SSK_SSD/serpent_recordings')
+TELEMETRY_RETENTION_DAYS = _i('TELEMETRY_RETENTION_DAYS', 3650)  # ~10 years (no auto-delete)
+COMMAND_RETENTION_DAYS = _i('COMMAND_RETENTION_DAYS', 3650)  # ~10 years (no auto-delete)
 
 # Controller telemetry rate (10 Hz for <100ms latency)
-CONTROLLER_TELEMETRY_RATE_HZ = float(os.getenv('CONTROLLER_TELEM_RATE', '10.0'))
+CONTROLLER_TELEMETRY_RATE_HZ = _f('CONTROLLER_TELEM_RATE', 10.0)
+
+# Identical clamp/brake commands repeated within this window are dropped, to
+# absorb backend replays after a reconnect (0 = off, the default). Other
+# commands and E-STOP events are never affected by it.
+COMMAND_DEDUP_WINDOW_S = _f('COMMAND_DEDUP_WINDOW', 0.0)
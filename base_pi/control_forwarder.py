@@ -5,22 +5,78 @@ SAFETY:
 - All commands are authenticated with HMAC-SHA256
 - Sequence numbers prevent replay attacks
 - Socket timeouts prevent indefinite blocking
+- Non-blocking sends: a full send buffer drops ordinary commands instead of
+  stalling the sender; E-STOP frames wait (bounded) until they are sent
 """
 
 import socket
-import json
+import select
 import time
 import logging
 import threading
-import os
-import sys
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Sequence, Tuple
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from common.framing import SecureFramer, FramingError
+from common.json_codec import dumps_bytes
+from common.constants import MSG_EMERGENCY_STOP
 
 logger = logging.getLogger(__name__)
 
+_EMPTY_DATA = b'{}'
+
+# Upper bound on time spent finishing a frame once any byte of it is queued
+# (or waiting for buffer space for an E-STOP frame)
+SEND_TIMEOUT_S = 3.0
+
+
+class SendBufferFull(Exception):
+    """Socket send buffer full; frame not sent (nothing written)"""
+    pass
+
+
+# sendmsg() takes at most IOV_MAX (1024 on Linux) buffers; bigger batches are joined
+_MAX_SEND_BUFFERS = 1024
+
+
+# Setpoint streams that repeat the same small data dict many times, and
+# E-STOP, whose few fixed payloads should cost no encoding on the send path
+_MEMOIZED_TYPES = frozenset(('height_update', 'force_update', MSG_EMERGENCY_STOP))
+
+
+@lru_cache(maxsize=64)
+def _payload_prefix(command_type: str) -> bytes:
+    """Encoded '{"type":<command_type>,"data":' prefix (cached per type)."""
+    return b'{"type":' + dumps_bytes(command_type) + b',"data":'
+
+
+@lru_cache(maxsize=128)
+def _encoded_items(items: tuple) -> bytes:
+    """Encoded data dict for a ((key, type, value), ...) key (LRU cached)."""
+    return dumps_bytes({key: value for key, _, value in items})
+
+
+def _encode_data(command_type: str, data: Dict[str, Any]) -> bytes:
+    """Encode command data, memoizing repeated setpoint payloads."""
+    if command_type in _MEMOIZED_TYPES:
+        # type() is part of the key so True/1/1.0 don't share a cache entry
+        try:
+            return _encoded_items(tuple((k, type(v), v) for k, v in data.items()))
+        except TypeError:
+            pass  # Unhashable value (list/dict) - encode directly
+    return dumps_bytes(data)
+
+
+def _build_payload(command_type: str, data: Dict[str, Any]) -> bytes:
+    """Same JSON as {"type", "data", "timestamp"} without building the dict."""
+    return b''.join((
+        _payload_prefix(command_type),
+        _encode_data(command_type, data) if data else _EMPTY_DATA,
+        b',"timestamp":',
+        repr(time.time()).encode(),
+        b'}'
+    ))
+
 
 class ControlForwarder:
     """Forwards authenticated control commands to Robot Pi over TCP"""
@@ -41,69 +97,140 @@ class ControlForwarder:
         self.socket: Optional[socket.socket] = None
         self.connected = False
         self.running = False
+        # Guards swapping/closing self.socket (connect/disconnect only)
         self.lock = threading.Lock()
+        # Serializes frame creation + sendall so frames hit the wire whole
+        # and in sequence-number order (robot rejects out-of-order seq)
+        self._send_lock = threading.Lock()
+        # Set when the link is lost so the reconnect thread wakes immediately
+        self._reconnect_event = threading.Event()
 
         # Track send statistics
         self.commands_sent = 0
         self.commands_failed = 0
+        # time.monotonic() of the last frame that reached the socket
+        self.last_send_time = 0.0
 
-        logger.info(f"ControlForwarder initialized for {robot_ip}:{control_port}")
+        logger.info("ControlForwarder initialized for %s:%s", robot_ip, control_port)
 
     def connect(self) -> bool:
         """Establish connection to Robot Pi"""
+        # Close any previous socket before reconnecting
+        with self.lock:
+            old_sock, self.socket = self.socket, None
+        if old_sock:
+            try:
+                old_sock.close()
+            except:
+                pass
+
+        sock = None
         try:
-            with self.lock:
-                if self.socket:
-                    try:
-                        self.socket.close()
-                    except:
-                        pass
-
-                self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-
-                # PRIORITY: Disable Nagle's algorithm for low-latency control
-                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-
-                # Enable TCP keepalive for faster dead connection detection
-                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
-                # Linux-specific keepalive settings (in seconds)
-                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 5)   # Start after 5s idle
-                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 2)  # Probe every 2s
-                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)    # 3 probes before dead
-
-                self.socket.settimeout(5.0)
-                self.socket.connect((self.robot_ip, self.control_port))
-                # Keep timeout for all operations - prevent indefinite blocking
-                self.socket.settimeout(3.0)  # Reduced from 5s for faster failure detection
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+
+            # PRIORITY: Disable Nagle's algorithm for low-latency control
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            # Enable TCP keepalive for faster dead connection detection
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Linux-specific keepalive settings (in seconds)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 5)   # Start after 5s idle
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 2)  # Probe every 2s
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)    # 3 probes before dead
+
+            # Connect outside the lock so a slow connect never stalls the send path
+            sock.settimeout(5.0)
+            sock.connect((self.robot_ip, self.control_port))
+            # Linux: ACK immediately instead of delayed-ACK (pairs with TCP_NODELAY).
+            # One-shot is enough: nothing is read back on the control socket.
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+            except (AttributeError, OSError):
+                pass
+            # Non-blocking sends; _send_frame bounds any wait by SEND_TIMEOUT_S
+            sock.setblocking(False)
 
+            with self.lock:
+                self.socket = sock
                 self.connected = True
-                logger.info(f"Connected to Robot Pi at {self.robot_ip}:{self.control_port}")
-                return True
+            logger.info("Connected to Robot Pi at %s:%s", self.robot_ip, self.control_port)
+            return True
 
         except Exception as e:
-            logger.error(f"Failed to connect to Robot Pi: {e}")
+            logger.error("Failed to connect to Robot Pi: %s", e)
             self.connected = False
-            with self.lock:
-                if self.socket:
-                    try:
-                        self.socket.close()
-                    except:
-                        pass
-                    self.socket = None
+            if sock:
+                try:
+                    sock.close()
+                except:
+                    pass
             return False
 
     def disconnect(self):
         """Disconnect from Robot Pi"""
         with self.lock:
             self.connected = False
-            if self.socket:
-                try:
-                    self.socket.close()
-                except:
-                    pass
-                self.socket = None
+            sock, self.socket = self.socket, None
+        if sock:
+            try:
+                sock.close()
+            except:
+                pass
         logger.info("Disconnected from Robot Pi")
 
+    def _record_command(self, command_type: str, data: Dict[str, Any], success: bool):
+        """Invoke the command recording callback, if set."""
+        if self.on_command_sent:
+            try:
+                self.on_command_sent(command_type, data, success)
+            except Exception as cb_err:
+                logger.debug("Command callback error: %s", cb_err)
+
+    def _send_frame(self, sock: socket.socket, buffers: List[bytes], wait: bool):
+        """
+        Send one or more frames (header, payload, ...) on a non-blocking socket.
+
+        Tries a single scatter/gather sendmsg first. If the kernel buffer is
+        full and nothing was written, raises SendBufferFull unless `wait` is
+        set. Once part of a frame is written the rest is always completed
+        (a truncated frame would desync the stream), bounded by SEND_TIMEOUT_S.
+
+        Header and payload are handed to the kernel in the same sendmsg call,
+        so a frame that fits the MSS already leaves as one segment; TCP_CORK /
+        MSG_MORE would add nothing here and risk holding E-STOP frames back.
+
+        Raises:
+            SendBufferFull: Buffer full and wait=False (frame not sent)
+            socket.timeout: Frame could not be completed in time
+            OSError: Socket error
+        """
+        if len(buffers) > _MAX_SEND_BUFFERS:
+            buffers = [b''.join(buffers)]
+        total = sum(map(len, buffers))
+        try:
+            sent = sock.sendmsg(buffers, [], socket.MSG_DONTWAIT)
+        except BlockingIOError:
+            if not wait:
+                raise SendBufferFull()
+            sent = 0
+
+        if sent == total:
+            return
+
+        remaining = memoryview(b''.join(buffers))[sent:]
+        deadline = time.monotonic() + SEND_TIMEOUT_S
+        while remaining:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                raise socket.timeout("timed out completing control frame")
+            _, writable, _ = select.select([], [sock], [], timeout)
+            if not writable:
+                continue
+            try:
+                remaining = remaining[sock.send(remaining, socket.MSG_DONTWAIT):]
+            except BlockingIOError:
+                continue
+
     def send_command(self, command_type: str, data: Dict[str, Any] = None) -> bool:
         """
         Send an authenticated control command to Robot Pi.
@@ -115,80 +242,93 @@ class ControlForwarder:
         Returns:
             True if sent successfully, False otherwise
         """
+        return self._send_commands(((command_type, data or {}),), command_type)
+
+    def send_commands_batch(self, commands: Sequence[Tuple[str, Optional[Dict[str, Any]]]]) -> bool:
+        """
+        Send several authenticated commands with one send syscall.
+
+        Each command is its own frame with its own sequence number, exactly as
+        if sent one by one; the frames are just handed to the kernel together.
+        All-or-nothing: on failure none of the commands count as sent.
+
+        Frames are not merged under a single HMAC: the robot verifies and
+        acts on each frame independently (an E-STOP must never wait on, or
+        be rejected with, its neighbours), and the keyed HMAC template makes
+        the per-frame MAC cost small.
+
+        Args:
+            commands: (command_type, data) pairs, in send order
+
+        Returns:
+            True if all were sent, False otherwise
+        """
+        commands = [(command_type, data or {}) for command_type, data in commands]
+        if not commands:
+            return True
+        if len(commands) == 1:
+            return self._send_commands(commands, commands[0][0])
+        return self._send_commands(commands, f"batch of {len(commands)}")
+
+    def _send_commands(self, commands: Sequence[Tuple[str, Dict[str, Any]]], name: str) -> bool:
+        """Frame and send commands in one sendmsg (name is used in log messages)."""
         if not self.connected:
-            logger.warning(f"Not connected, cannot send command: {command_type}")
-            self.commands_failed += 1
+            logger.warning("Not connected, cannot send command: %s", name)
+            self.commands_failed += len(commands)
             return False
 
         if not self.framer.is_authenticated():
-            logger.error(f"Cannot send command {command_type}: No PSK configured")
-            self.commands_failed += 1
+            logger.error("Cannot send command %s: No PSK configured", name)
+            self.commands_failed += len(commands)
             return False
 
-        message = {
-            "type": command_type,
-            "data": data or {},
-            "timestamp": time.time()
-        }
+        # Snapshot the socket; connect/disconnect swap it under self.lock
+        sock = self.socket
+        if sock is None:
+            logger.warning("Socket is None, cannot send command")
+            self._record_failed(commands)
+            return False
 
         try:
-            with self.lock:
-                if self.socket:
-                    # Create authenticated frame
-                    payload = json.dumps(message).encode('utf-8')
-                    frame = self.framer.create_frame(payload)
-
-                    self.socket.sendall(frame)
-                    self.commands_sent += 1
-                    logger.debug(f"Sent command: {command_type} (seq={self.framer.get_send_seq()})")
-
-                    # Record command if callback is set
-                    if self.on_command_sent:
-                        try:
-                            self.on_command_sent(command_type, data or {}, True)
-                        except Exception as cb_err:
-                            logger.debug(f"Command callback error: {cb_err}")
-
-                    return True
-                else:
-                    logger.warning("Socket is None, cannot send command")
-                    self.commands_failed += 1
-
-                    # Record failed command if callback is set
-                    if self.on_command_sent:
-                        try:
-                            self.on_command_sent(command_type, data or {}, False)
-                        except Exception as cb_err:
-                            logger.debug(f"Command callback error: {cb_err}")
-
-                    return False
+            payloads = [_build_payload(command_type, data) for command_type, data in commands]
+            wait = any(command_type == MSG_EMERGENCY_STOP for command_type, _ in commands)
+            with self._send_lock:
+                # Create authenticated frames; all headers and payloads go out in one sendmsg
+                buffers = []
+                for payload in payloads:
+                    buffers.extend(self.framer.create_frame_parts(payload))
+                self._send_frame(sock, buffers, wait=wait)
+                self.commands_sent += len(commands)
+                self.last_send_time = time.monotonic()
+            logger.debug("Sent command: %s (seq=%s)", name, self.framer.get_send_seq())
+
+        except SendBufferFull:
+            logger.warning("Send buffer full, dropped command: %s", name)
+            self._record_failed(commands)
+            return False
 
         except FramingError as e:
-            logger.error(f"Framing error for {command_type}: {e}")
-            self.commands_failed += 1
-
-            # Record failed command if callback is set
-            if self.on_command_sent:
-                try:
-                    self.on_command_sent(command_type, data or {}, False)
-                except Exception as cb_err:
-                    logger.debug(f"Command callback error: {cb_err}")
-
+            logger.error("Framing error for %s: %s", name, e)
+            self._record_failed(commands)
             return False
 
         except Exception as e:
-            logger.error(f"Failed to send command {command_type}: {e}")
+            logger.error("Failed to send command %s: %s", name, e)
             self.connected = False
-            self.commands_failed += 1
+            self._reconnect_event.set()
+            self._record_failed(commands)
+            return False
 
-            # Record failed command if callback is set
-            if self.on_command_sent:
-                try:
-                    self.on_command_sent(command_type, data or {}, False)
-                except Exception as cb_err:
-                    logger.debug(f"Command callback error: {cb_err}")
+        # Record commands outside the send lock
+        for command_type, data in commands:
+            self._record_command(command_type, data, True)
+        return True
 
-            return False
+    def _record_failed(self, commands: Sequence[Tuple[str, Dict[str, Any]]]):
+        """Count and record commands that were not sent."""
+        self.commands_failed += len(commands)
+        for command_type, data in commands:
+            self._record_command(command_type, data, False)
 
     def start(self):
         """Start the control forwarder with auto-reconnect"""
@@ -201,10 +341,12 @@ class ControlForwarder:
                     if self.connect():
                         logger.info("Connection established")
                     else:
-                        logger.warning(f"Connection failed, retrying in {self.reconnect_delay}s")
+                        logger.warning("Connection failed, retrying in %ss", self.reconnect_delay)
                         time.sleep(self.reconnect_delay)
                 else:
-                    time.sleep(1.0)
+                    # Sleep until a send fails (or periodically re-check)
+                    self._reconnect_event.wait(timeout=5.0)
+                    self._reconnect_event.clear()
 
         self.reconnect_thread = threading.Thread(target=reconnect_thread, daemon=True)
         self.reconnect_thread.start()
@@ -214,13 +356,18 @@ class ControlForwarder:
     def stop(self):
         """Stop the control forwarder"""
         self.running = False
+        self._reconnect_event.set()
         self.disconnect()
-        logger.info(f"ControlForwarder stopped (sent={self.commands_sent}, failed={self.commands_failed})")
+        logger.info("ControlForwarder stopped (sent=%s, failed=%s)", self.commands_sent, self.commands_failed)
 
     def is_connected(self) -> bool:
         """Check if connected to Robot Pi"""
         return self.connected
 
+    def get_last_send_time(self) -> float:
+        """Get time.monotonic() of the last successful send (0.0 if none)"""
+        return self.last_send_time
+
     def get_stats(self) -> dict:
         """Get command statistics"""
         return {
@@ -2,27 +2,37 @@
 Control Storage Module
 
 Record control commands to JSONL files on SSD with daily rotation.
-Thread-safe async write queue for non-blocking operation.
+A deque (atomic append/popleft) feeds a background writer thread for
+non-blocking operation; producers wake the writer through a self-pipe.
 """
 
-import json
 import logging
 import os
+import select
 import time
 import threading
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
-from queue import Queue, Empty
+from typing import Dict, Any, List, Optional
+
+from common.json_codec import dumps_bytes
 
 
 logger = logging.getLogger(__name__)
 
+# Batched writer tuning: drain up to WRITE_BATCH_MAX records per os.write()
+WRITE_BATCH_MAX = 128
+WRITE_QUEUE_MAX = 10000
+CLEANUP_INTERVAL_S = 600.0  # Retention cleanup runs on its own timer thread
+WRITER_JOIN_TIMEOUT_S = 5.0  # stop() waits this long for the writer to exit
+
 
 class ControlStorage:
     """
     Records control commands to JSONL files with daily rotation.
 
-    Format: One JSON object per line with timestamp and command data.
+    Format: One JSON object per line with timestamp (Unix epoch seconds) and
+    command data.
     Files: commands_YYYYMMDD.jsonl
     """
 
@@ -37,12 +47,21 @@ class ControlStorage:
         self.base_path = base_path
         self.retention_days = retention_days
         self.running = False
-        self.write_queue: Queue = Queue(maxsize=10000)
+        self.write_queue: deque = deque(maxlen=WRITE_QUEUE_MAX)
+        # Self-pipe wake-up: producers write one byte only when no wake is
+        # already pending, so the enqueue path takes no lock
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+        self._wake_pending = False
         self.writer_thread: Optional[threading.Thread] = None
+        self._cleanup_timer: Optional[threading.Timer] = None
 
-        # Current file
-        self.current_file: Optional[object] = None
+        # Current file (raw O_APPEND fd; unbuffered, so nothing to flush)
+        self.current_fd: Optional[int] = None
         self.current_file_date: Optional[str] = None
+        # Wall-clock minute of the last date check (the date only changes on
+        # a minute boundary, so one strftime per minute is enough)
+        self._date_check_minute = -1
 
         # Statistics
         self.commands_written = 0
@@ -53,21 +72,41 @@ class ControlStorage:
 
     def start(self):
         """Start the storage writer thread."""
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
         self.running = True
         self.writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
         self.writer_thread.start()
+        self._schedule_cleanup()
         logger.info(f"Control storage started (path: {self.base_path}, retention: {self.retention_days} days)")
 
     def stop(self):
         """Stop the storage writer thread."""
         self.running = False
+        self._wake_writer()
+        if self._cleanup_timer:
+            self._cleanup_timer.cancel()
+            self._cleanup_timer = None
         if self.writer_thread:
-            self.writer_thread.join(timeout=5.0)
-
-        # Close current file
-        if self.current_file:
-            self.current_file.close()
-            self.current_file = None
+            self.writer_thread.join(timeout=WRITER_JOIN_TIMEOUT_S)
+            if self.writer_thread.is_alive():
+                # Still inside a write: it drains the queue itself when it
+                # exits, so don't write to (or close) its file from here
+                logger.warning(f"Control storage writer did not exit within "
+                               f"{WRITER_JOIN_TIMEOUT_S}s, leaving it to drain")
+                return
+
+        # Write anything queued after the writer exited, then close current file
+        self._drain_remaining()
+        if self.current_fd is not None:
+            os.close(self.current_fd)
+            self.current_fd = None
+
+        for fd in (self._wake_r, self._wake_w):
+            if fd is not None:
+                os.close(fd)
+        self._wake_r = self._wake_w = None
 
         logger.info(f"Control storage stopped (written: {self.commands_written}, dropped: {self.commands_dropped})")
 
@@ -82,106 +121,161 @@ class ControlStorage:
         """
         record = {
             'timestamp': time.time(),
-            'datetime': datetime.now().isoformat(),
             'type': command_type,
             'data': data,
             'success': success
         }
 
-        try:
-            self.write_queue.put_nowait(record)
-        except:
+        if len(self.write_queue) >= WRITE_QUEUE_MAX:
             # Queue full, drop record (prefer real-time over storage)
             self.commands_dropped += 1
+            return
 
-    def _writer_loop(self):
-        """Background writer loop (processes write queue)."""
-        last_cleanup_time = time.time()
+        self.write_queue.append(record)
+        if not self._wake_pending:
+            self._wake_writer()
 
+    def _wake_writer(self):
+        """Wake the writer thread (one byte on the self-pipe)."""
+        self._wake_pending = True
+        try:
+            os.write(self._wake_w, b'x')
+        except (TypeError, OSError):
+            pass  # Pipe full (wake already pending) or not started
+
+    def _writer_loop(self):
+        """Background writer loop (drains write queue in batches)."""
         while self.running:
             try:
-                # Get command from queue (with timeout)
-                try:
-                    record = self.write_queue.get(timeout=1.0)
-                except Empty:
+                # Clear before draining so an append during the drain wakes us again
+                self._wake_pending = False
+                batch = self._pop_batch(WRITE_BATCH_MAX)
+                if not batch:
+                    readable, _, _ = select.select([self._wake_r], [], [], 1.0)
+                    if readable:
+                        os.read(self._wake_r, 4096)
                     continue
 
                 # Rotate file if needed (new day)
                 self._rotate_file_if_needed()
 
-                # Write to file
-                self._write_to_file(record)
-
-                # Periodic cleanup (every 10 minutes)
-                now = time.time()
-                if now - last_cleanup_time > 600:
-                    self._cleanup_old_files()
-                    last_cleanup_time = now
+                # Write batch to file
+                self._write_batch(batch)
 
             except Exception as e:
                 logger.error(f"Error in control storage writer loop: {e}")
                 time.sleep(1.0)
 
+        # Shutting down: write what is still queued before exiting
+        self._drain_remaining()
+
+    def _schedule_cleanup(self):
+        """Arm the retention cleanup timer (re-arms itself while running)."""
+        if not self.running:
+            return
+        self._cleanup_timer = threading.Timer(CLEANUP_INTERVAL_S, self._cleanup_timer_fired)
+        self._cleanup_timer.daemon = True
+        self._cleanup_timer.start()
+
+    def _cleanup_timer_fired(self):
+        """Timer callback: clean up old files off the writer thread, then re-arm."""
+        self._cleanup_old_files()
+        self._schedule_cleanup()
+
+    def _pop_batch(self, max_records: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Pop up to max_records queued records (all if None), oldest first."""
+        batch = []
+        popleft = self.write_queue.popleft
+        while max_records is None or len(batch) < max_records:
+            try:
+                batch.append(popleft())
+            except IndexError:
+                break
+        return batch
+
+    def _drain_remaining(self):
+        """Write out any records still queued (called on shutdown)."""
+        batch = self._pop_batch()
+        if batch:
+            try:
+                self._rotate_file_if_needed()
+                self._write_batch(batch)
+            except Exception as e:
+                logger.error(f"Error draining control storage queue: {e}")
+
     def _rotate_file_if_needed(self):
         """Check if we need to rotate to a new file (new day)."""
+        minute = int(time.time()) // 60
+        if minute == self._date_check_minute and self.current_fd is not None:
+            return
+        self._date_check_minute = minute
+
         today = datetime.now().strftime("%Y%m%d")
 
         if self.current_file_date != today:
             # Close current file
-            if self.current_file:
-                self.current_file.close()
+            if self.current_fd is not None:
+                os.close(self.current_fd)
+                self.current_fd = None
                 logger.info(f"Closed command log: commands_{self.current_file_date}.jsonl")
 
             # Open new file for today
             filename = f"commands_{today}.jsonl"
             file_path = os.path.join(self.base_path, filename)
-            self.current_file = open(file_path, 'a', encoding='utf-8')
+            self.current_fd = os.open(file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
             self.current_file_date = today
 
             logger.info(f"Opened command log: {file_path}")
 
-    def _write_to_file(self, record: Dict[str, Any]):
+    def _write_batch(self, records: List[Dict[str, Any]]):
         """
-        Write a command record to the current file.
+        Write a batch of command records to the current file with one os.write().
 
         Args:
-            record: Command record dictionary
+            records: Command record dictionaries
         """
-        if not self.current_file:
+        if self.current_fd is None:
             return
 
         try:
-            # Write as single JSON line
-            line = json.dumps(record, separators=(',', ':')) + '\n'
-            self.current_file.write(line)
-            self.current_file.flush()
-            self.commands_written += 1
+            # One JSON object per line, single write for the whole batch
+            lines = [dumps_bytes(record) for record in records]
+            buf = memoryview(b'\n'.join(lines) + b'\n')
+            while buf:
+                buf = buf[os.write(self.current_fd, buf):]
+            self.commands_written += len(records)
 
         except Exception as e:
-            logger.error(f"Error writing command to file: {e}")
+            logger.error(f"Error writing commands to file: {e}")
 
     def _cleanup_old_files(self):
         """Delete command log files older than retention period."""
         try:
+            # Compare YYYYMMDD as integers (avoids strptime per file)
             cutoff_date = datetime.now() - timedelta(days=self.retention_days)
-
-            for filename in os.listdir(self.base_path):
-                if not filename.startswith('commands_') or not filename.endswith('.jsonl'):
-                    continue
-
-                # Extract date from filename
-                try:
-                    date_str = filename[9:17]  # commands_YYYYMMDD.jsonl
-                    file_date = datetime.strptime(date_str, "%Y%m%d")
-
-                    if file_date < cutoff_date:
-                        file_path = os.path.join(self.base_path, filename)
-                        # Don't delete current file
-                        if date_str != self.current_file_date:
-                            os.remove(file_path)
+            cutoff_int = int(cutoff_date.strftime("%Y%m%d"))
+            current_date = self.current_file_date
+
+            with os.scandir(self.base_path) as entries:
+                for entry in entries:
+                    filename = entry.name
+                    # commands_YYYYMMDD.jsonl
+                    if len(filename) != 23 or not filename.startswith('commands_') or not filename.endswith('.jsonl'):
+                        continue
+
+                    date_str = filename[9:17]
+                    try:
+                        file_int = int(date_str)
+                    except ValueError:
+                        continue
+
+                    # Don't delete current file
+                    if file_int < cutoff_int and date_str != current_date:
+                        try:
+                            os.remove(entry.path)
                             logger.info(f"Deleted old command log: {filename}")
-                except:
-                    pass
+                        except OSError as e:
+                            logger.error(f"Error deleting old command log {filename}: {e}")
 
         except Exception as e:
             logger.error(f"Error cleaning up old command logs: {e}")
@@ -191,6 +285,6 @@ class ControlStorage:
         return {
             'commands_written': self.commands_written,
             'commands_dropped': self.commands_dropped,
-            'queue_size': self.write_queue.qsize(),
+            'queue_size': len(self.write_queue),
             'current_file_date': self.current_file_date
         }
@@ -4,21 +4,90 @@ Backend Client for Base Pi
 Handles Socket.IO client connection to serpent_backend.
 Translates legacy events to proper protocol semantics.
 
+Runs socketio.AsyncClient on a dedicated asyncio event loop thread; sync
+callers (telemetry receiver, coordinator) hand emits to that loop without
+blocking. Command and E-STOP callbacks run on a separate single worker
+thread, so a send that waits on the robot link never stalls the loop.
+
 SAFETY:
 - Translates legacy 'emergency_toggle' to proper E-STOP ENGAGE
 - Validates E-STOP clear requests with confirmation
 - All commands are forwarded with HMAC authentication
 """
 
+import asyncio
+import concurrent.futures
+import functools
 import logging
 import time
+import threading
+from collections import deque
 import socketio
-from typing import Callable, Dict, Any, Optional
+from socketio import packet as socketio_packet
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 from common.constants import MSG_EMERGENCY_STOP, ESTOP_CLEAR_CONFIRM
+from common.json_codec import JSONModule
+from common.event_dedup import EventDedup
 
 logger = logging.getLogger(__name__)
 
+# E-STOP command labels for logs, indexed by bool(active)
+_ESTOP_LABELS = ('CLEAR', 'ENGAGE')
+
+MSGPACK_AVAILABLE = False
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    pass
+
+UVLOOP_AVAILABLE = False
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    pass
+
+# Max telemetry samples held between emit flushes (oldest dropped beyond this)
+TELEMETRY_EMIT_BUFFER_MAX = 100
+
+# Max time connect() waits for the initial Socket.IO handshake
+CONNECT_TIMEOUT_S = 10.0
+
+# E-STOP event names -> dedup class. All three are views of the same logical
+# E-STOP state, so an engage/clear arriving on several of them collapses to one.
+ESTOP_EVENT_CLASS: Dict[str, str] = {
+    'emergency_toggle': 'estop',
+    'emergency_stop': 'estop',
+    'emergency_status': 'estop',
+}
+
+# Pass-through command events: event name -> info log label (None = debug only).
+# Each is forwarded unchanged to Robot Pi as a command of the same name.
+# E-STOP events are NOT listed here; they have their own translation handlers.
+COMMAND_EVENTS: Dict[str, Optional[str]] = {
+    'clamp_close': 'Clamp close',
+    'clamp_open': 'Clamp open',
+    'height_update': None,
+    'force_update': None,
+    'start_camera': 'Start camera',
+    'input_event': None,
+    'raw_button_press': None,
+    'r1_button': 'R1 button',
+    'chainsaw_command': 'Chainsaw command',
+    'chainsaw_move': 'Chainsaw move',
+    'climb_command': 'Climb command',
+    'traverse_command': 'Traverse command',
+    'brake_command': 'Brake command',
+}
+
+# Pass-through events subject to command dedup (when enabled): discrete
+# commands the backend may replay after a reconnect. Everything else -
+# setpoint streams, raw input, chainsaw/climb/traverse - is always forwarded,
+# since an operator repeating the same command is meaningful there.
+DEDUP_COMMAND_EVENTS = frozenset(('clamp_close', 'clamp_open', 'brake_command'))
+
 
 class BackendClient:
     """
@@ -33,7 +102,12 @@ class BackendClient:
         backend_url: str,
         on_connection_change: Callable[[bool], None],
         on_command: Callable[[str, Dict[str, Any]], None],
-        on_emergency_status: Callable[[bool], None]
+        on_emergency_status: Callable[[bool], None],
+        telemetry_emit_interval: float = 0.1,
+        telemetry_batched: bool = False,
+        telemetry_msgpack: bool = False,
+        telemetry_latest_only: bool = False,
+        command_dedup_window: float = 0.0
     ):
         """
         Initialize backend client.
@@ -43,18 +117,68 @@ class BackendClient:
             on_connection_change: Callback for connection state changes
             on_command: Callback for commands (cmd_type, data)
             on_emergency_status: Callback for emergency_status events (active)
+            telemetry_emit_interval: Seconds between telemetry emit flushes
+            telemetry_batched: Emit one 'telemetry_batch' list per flush instead
+                of one 'telemetry' event per sample (backend must support it)
+            telemetry_msgpack: Send telemetry as msgpack bytes on '<event>_mp'
+                events (backend must support it; needs msgpack installed)
+            telemetry_latest_only: Emit only the newest sample per flush and
+                drop the rest of the window
+            command_dedup_window: Identical DEDUP_COMMAND_EVENTS commands repeated
+                within this many seconds are dropped (0 disables, the default)
         """
         self.backend_url = backend_url
         self.on_connection_change = on_connection_change
         self.on_command = on_command
         self.on_emergency_status = on_emergency_status
 
-        # Socket.IO client
-        self.sio = socketio.Client(reconnection=True, reconnection_delay=2)
-
-        # E-stop event tracking to prevent duplicates from multiple event types
-        self._last_estop_event_time: float = 0.0
-        self._last_estop_event_active: Optional[bool] = None
+        # Telemetry emit buffer, flushed by a task on the event loop so the
+        # telemetry receiver thread never blocks inside sio.emit()
+        self.telemetry_emit_interval = telemetry_emit_interval
+        self.telemetry_batched = telemetry_batched
+        self.telemetry_latest_only = telemetry_latest_only
+        self._packer = None
+        if telemetry_msgpack:
+            if MSGPACK_AVAILABLE:
+                # Only used on the event loop thread, so one Packer is safe to reuse
+                self._packer = msgpack.Packer(use_bin_type=True)
+            else:
+                logger.warning("TELEMETRY_EMIT_MSGPACK set but msgpack not installed - using JSON")
+        self._telem_buf: deque = deque(maxlen=TELEMETRY_EMIT_BUFFER_MAX)
+        self._telem_lock = threading.Lock()
+
+        # Event loop (own thread) driving the async Socket.IO client
+        self._loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+        self._loop_thread: Optional[threading.Thread] = None
+        self._emit_task: Optional[asyncio.Future] = None
+
+        # on_command / on_emergency_status end in ControlForwarder sends, which
+        # can wait up to SEND_TIMEOUT_S on a full robot link. They run here,
+        # off the event loop; one worker keeps them in arrival order.
+        self._callback_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='backend-callbacks'
+        )
+
+        # Socket.IO client (packets encoded with orjson when installed).
+        # Exponential backoff with jitter so bridges don't reconnect in lockstep
+        # after a backend restart; capped low because this link carries E-STOP.
+        self.sio = socketio.AsyncClient(
+            reconnection=True,
+            reconnection_attempts=0,
+            reconnection_delay=1,
+            reconnection_delay_max=5,
+            randomization_factor=0.5,
+            json=JSONModule
+        )
+
+        # Command dedup for DEDUP_COMMAND_EVENTS (coalesces reconnect replays)
+        self._command_dedup: Optional[EventDedup] = None
+        if command_dedup_window > 0:
+            self._command_dedup = EventDedup(window_s=command_dedup_window)
+
+        # E-stop event dedup: the same (class, active) within the window is dropped
+        self._last_estop_key: Optional[Tuple[str, bool]] = None
+        self._last_estop_ts: float = 0.0
         self._estop_event_window_s: float = 0.1  # 100ms window to catch near-simultaneous events
 
         # Track when a clear was last forwarded so we can suppress the legacy
@@ -64,19 +188,20 @@ class BackendClient:
         self._clear_suppress_s: float = 2.0  # suppress toggle re-engage for 2s after clear
 
         self._setup_handlers()
+        self._warm_up()
 
-        logger.info(f"BackendClient initialized (url={backend_url})")
+        logger.info("BackendClient initialized (url=%s)", backend_url)
 
     def _setup_handlers(self):
         """Setup Socket.IO event handlers."""
 
         @self.sio.event
-        def connect():
+        async def connect():
             logger.info("Connected to serpent_backend")
             self.on_connection_change(True)
 
         @self.sio.event
-        def disconnect():
+        async def disconnect():
             logger.warning("Disconnected from serpent_backend")
             self.on_connection_change(False)
 
@@ -91,7 +216,7 @@ class BackendClient:
         # =====================================================================
 
         @self.sio.on('emergency_toggle')
-        def on_emergency_toggle(data):
+        async def on_emergency_toggle(data):
             """
             Legacy event from backend - always means ENGAGE.
             Routed through unified handler to prevent duplicates.
@@ -101,14 +226,14 @@ class BackendClient:
             so without suppression it can race and re-engage the robot right after
             the clear goes through.
             """
-            if time.time() - self._last_clear_forwarded_time < self._clear_suppress_s:
+            if time.monotonic() - self._last_clear_forwarded_time < self._clear_suppress_s:
                 logger.debug("emergency_toggle: suppressed — clear recently forwarded, ignoring re-engage")
                 return
             logger.info("Received emergency_toggle event")
             self._handle_emergency_event(True, 'emergency_toggle')
 
         @self.sio.on('emergency_stop')
-        def on_emergency_stop(data):
+        async def on_emergency_stop(data):
             """
             Proper emergency_stop event with explicit engage/clear.
             Routed through unified handler to prevent duplicates.
@@ -117,11 +242,11 @@ class BackendClient:
                 logger.warning("emergency_stop event missing 'engage' field - ignoring to avoid spurious e-stop")
                 return
             engage = data['engage']
-            logger.info(f"Received emergency_stop event (engage={engage})")
+            logger.info("Received emergency_stop event (engage=%s)", engage)
             self._handle_emergency_event(engage, 'emergency_stop')
 
         @self.sio.on('emergency_status')
-        def on_emergency_status_event(data):
+        async def on_emergency_status_event(data):
             """
             Status broadcast from backend (triggered by TrimUI).
             Routed through unified handler to prevent duplicates.
@@ -130,70 +255,40 @@ class BackendClient:
                 logger.warning("emergency_status event missing 'active' field - ignoring to avoid spurious e-stop")
                 return
             active = data['active']
-            logger.info(f"Received emergency_status event (active={active})")
+            logger.info("Received emergency_status event (active=%s)", active)
             self._handle_emergency_event(active, 'emergency_status')
 
-        @self.sio.on('clamp_close')
-        def on_clamp_close(data):
-            logger.info("Clamp close received")
-            self.on_command('clamp_close', data)
-
-        @self.sio.on('clamp_open')
-        def on_clamp_open(data):
-            logger.info("Clamp open received")
-            self.on_command('clamp_open', data)
-
-        @self.sio.on('height_update')
-        def on_height_update(data):
-            self.on_command('height_update', data)
-
-        @self.sio.on('force_update')
-        def on_force_update(data):
-            self.on_command('force_update', data)
-
-        @self.sio.on('start_camera')
-        def on_start_camera(data):
-            camera_id = data.get('camera_id', 0)
-            logger.info(f"Start camera: {camera_id}")
-            self.on_command('start_camera', data)
-
-        @self.sio.on('input_event')
-        def on_input_event(data):
-            self.on_command('input_event', data)
-
-        @self.sio.on('raw_button_press')
-        def on_raw_button_press(data):
-            self.on_command('raw_button_press', data)
-
-        @self.sio.on('r1_button')
-        def on_r1_button(data):
-            logger.info(f"R1 button: {data.get('action', 'unknown')}")
-            self.on_command('r1_button', data)
-
-        @self.sio.on('chainsaw_command')
-        def on_chainsaw_command(data):
-            logger.info(f"Chainsaw command: {data}")
-            self.on_command('chainsaw_command', data)
-
-        @self.sio.on('chainsaw_move')
-        def on_chainsaw_move(data):
-            logger.info(f"Chainsaw move: {data}")
-            self.on_command('chainsaw_move', data)
-
-        @self.sio.on('climb_command')
-        def on_climb_command(data):
-            logger.info(f"Climb command: {data}")
-            self.on_command('climb_command', data)
-
-        @self.sio.on('traverse_command')
-        def on_traverse_command(data):
-            logger.info(f"Traverse command: {data}")
-            self.on_command('traverse_command', data)
-
-        @self.sio.on('brake_command')
-        def on_brake_command(data):
-            logger.info(f"Brake command: {data}")
-            self.on_command('brake_command', data)
+        # Pass-through command events: one shared dispatcher with the event
+        # name, log label and dedup table bound per event at setup time.
+        # Registered per event rather than as a '*' catch-all: the client finds
+        # the handler with one dict lookup either way, and unknown events stay
+        # unhandled instead of reaching the robot.
+        for event, label in COMMAND_EVENTS.items():
+            dedup = self._command_dedup if event in DEDUP_COMMAND_EVENTS else None
+            self.sio.on(event, functools.partial(
+                self._dispatch_command, event, label, dedup
+            ))
+
+    def _dispatch_command(self, event: str, label: Optional[str],
+                          dedup: Optional[EventDedup], data: Any = None):
+        """
+        Forward a pass-through command event to the command callback.
+
+        Args:
+            event: Socket.IO event name (bound at registration)
+            label: Info log label, None for debug-only (bound at registration)
+            dedup: Duplicate filter, None if disabled (bound at registration)
+            data: Event payload
+        """
+        if dedup is not None and not dedup.check(event, data):
+            logger.debug("Dropping duplicate %s", event)
+            return
+
+        if label:
+            logger.info("%s: %s", label, data)
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s: %s", event, data)
+        self._run_callback(self.on_command, event, data)
 
     def _handle_emergency_event(self, active: bool, source: str):
         """
@@ -206,19 +301,33 @@ class BackendClient:
             active: True to engage E-stop, False to clear
             source: Event source for logging
         """
-        # Simple dedup: ignore if same as last event
-        if self._last_estop_event_active == active:
-            logger.debug(f"E-STOP: ignoring duplicate {source} (already {'ENGAGE' if active else 'CLEAR'})")
+        # Windowed dedup: ignore the same logical event repeated within the window
+        key = (ESTOP_EVENT_CLASS.get(source, source), active)
+        now = time.monotonic()
+        if key == self._last_estop_key and now - self._last_estop_ts < self._estop_event_window_s:
+            logger.debug("E-STOP: ignoring duplicate %s (already %s)", source, _ESTOP_LABELS[bool(active)])
             return
 
-        self._last_estop_event_active = active
+        self._last_estop_key = key
+        self._last_estop_ts = now
 
         # Track when a clear was forwarded so emergency_toggle suppression works
         if not active:
-            self._last_clear_forwarded_time = time.time()
+            self._last_clear_forwarded_time = time.monotonic()
+
+        logger.info("E-STOP: forwarding %s (active=%s) to robot", source, active)
+        self._run_callback(self.on_emergency_status, active, source)
+
+    def _run_callback(self, callback: Callable, *args):
+        """Run a coordinator callback on the callback worker (FIFO, off the event loop)."""
+        future = self._callback_executor.submit(callback, *args)
+        future.add_done_callback(self._log_callback_error)
 
-        logger.info(f"E-STOP: forwarding {source} (active={active}) to robot")
-        self.on_emergency_status(active, source)
+    @staticmethod
+    def _log_callback_error(future: concurrent.futures.Future):
+        """Log an exception raised by a coordinator callback."""
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Backend command callback error: %s", future.exception())
 
     def sync_estop_engaged(self):
         """
@@ -228,54 +337,158 @@ class BackendClient:
         we forwarded a clear — meaning the robot rejected the clear. Resetting allows
         the next clear attempt to pass the dedup check.
         """
-        if self._last_estop_event_active is False:
+        if self._last_estop_key is not None and self._last_estop_key[1] is False:
             logger.info("E-STOP event dedup sync: robot still engaged — resetting to allow clear retry")
-            self._last_estop_event_active = True
+            self._last_estop_key = None
+
+    def _warm_up(self):
+        """
+        Encode a throwaway event packet so the packet/JSON encode path is
+        loaded and warm before the first real telemetry emit after startup.
+        """
+        try:
+            self.sio.packet_class(
+                socketio_packet.EVENT, data=['telemetry', {'timestamp': time.time()}]
+            ).encode()
+        except Exception as e:
+            logger.debug("Socket.IO warm-up skipped: %s", e)
+
+    def _run_on_loop(self, coro) -> asyncio.Future:
+        """Schedule a coroutine on the client event loop (thread-safe)."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
 
     def connect(self):
         """Connect to backend Socket.IO server."""
+        if self._loop_thread is None:
+            self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+            self._loop_thread.start()
+            self._emit_task = self._run_on_loop(self._emit_loop())
+
         try:
-            logger.info(f"Connecting to serpent_backend at {self.backend_url}")
-            self.sio.connect(self.backend_url)
+            logger.info("Connecting to serpent_backend at %s", self.backend_url)
+            # websocket only: skip the long-poll handshake and upgrade window
+            self._run_on_loop(
+                self.sio.connect(self.backend_url, transports=['websocket'])
+            ).result(timeout=CONNECT_TIMEOUT_S)
+        except concurrent.futures.TimeoutError:
+            # The attempt keeps running on the loop; the connect handler
+            # reports success if it completes later
+            logger.error("Backend handshake not complete after %.0fs", CONNECT_TIMEOUT_S)
+            logger.warning("Will retry in background...")
         except Exception as e:
-            logger.error(f"Failed to connect to backend: {e}")
+            logger.error("Failed to connect to backend: %s", e)
             logger.warning("Will retry in background...")
 
     def disconnect(self):
         """Disconnect from backend."""
+        if self._loop_thread is None:
+            return
+
         try:
             if self.sio.connected:
-                self.sio.disconnect()
+                self._run_on_loop(self.sio.disconnect()).result(timeout=2.0)
         except Exception as e:
-            logger.error(f"Error disconnecting from backend: {e}")
+            logger.error("Error disconnecting from backend: %s", e)
+
+        if self._emit_task:
+            self._emit_task.cancel()
+            self._emit_task = None
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(timeout=1.0)
+        self._loop_thread = None
 
     def emit_telemetry(self, telemetry: Dict[str, Any]):
         """
-        Emit telemetry to backend.
+        Queue telemetry for emit to backend (sent by the emit task).
 
         Args:
             telemetry: Telemetry data dictionary
         """
+        with self._telem_lock:
+            self._telem_buf.append(telemetry)
+
+    def emit_telemetry_batch(self, samples: List[Dict[str, Any]]):
+        """
+        Queue several telemetry samples at once (one lock acquisition).
+
+        Args:
+            samples: Telemetry dictionaries, oldest first
+        """
+        with self._telem_lock:
+            self._telem_buf.extend(samples)
+
+    async def _emit_loop(self):
+        """
+        Flush buffered telemetry once per tumbling window.
+
+        Ticks are scheduled on fixed deadlines so flush time does not
+        stretch the window.
+        """
+        next_tick = self._loop.time()
+        while True:
+            next_tick += self.telemetry_emit_interval
+            now = self._loop.time()
+            if next_tick < now:
+                next_tick = now  # skip windows missed while blocked
+            await asyncio.sleep(next_tick - now)
+            await self._flush_telemetry()
+
+    async def _flush_telemetry(self):
+        """Emit buffered telemetry samples (only the newest in latest-only mode)."""
+        with self._telem_lock:
+            if not self._telem_buf:
+                return
+            if self.telemetry_latest_only:
+                batch = [self._telem_buf[-1]]
+            else:
+                batch = list(self._telem_buf)
+            self._telem_buf.clear()
+
+        if not self.sio.connected:
+            return
+
         try:
-            self.sio.emit('telemetry', telemetry)
+            if self.telemetry_batched:
+                await self._emit('telemetry_batch', batch)
+            else:
+                for telemetry in batch:
+                    await self._emit('telemetry', telemetry)
         except Exception as e:
-            logger.error(f"Failed to emit telemetry: {e}")
+            logger.error("Failed to emit telemetry: %s", e)
+
+    async def _emit(self, event: str, data: Any):
+        """
+        Emit an event, as a '<event>_mp' binary msgpack payload when enabled.
+
+        Runs on the event loop thread (the cached Packer is not thread-safe).
+        """
+        if self._packer is not None:
+            await self.sio.emit(event + '_mp', self._packer.pack(data))
+        else:
+            await self.sio.emit(event, data)
 
     def emit_controller_telemetry(self, telemetry: Dict[str, Any]):
         """
-        Emit controller telemetry to backend.
+        Emit controller telemetry to backend (fire-and-forget on the event loop).
 
         Args:
             telemetry: Controller telemetry data dictionary
         """
+        if self._loop_thread is None:
+            return
+
+        self._run_on_loop(self._emit_controller_telemetry(telemetry))
+
+    async def _emit_controller_telemetry(self, telemetry: Dict[str, Any]):
+        """Emit controller telemetry (runs on the event loop)."""
         try:
-            self.sio.emit('controller_telemetry', telemetry)
-            logger.debug(f"Sent controller telemetry: status={telemetry.get('status')}, "
-                        f"voltage={telemetry.get('voltage')}V, "
-                        f"altitude={telemetry.get('altitude')}m, "
-                        f"rtt={telemetry.get('rtt_ms')}ms")
+            await self._emit('controller_telemetry', telemetry)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sent controller telemetry: status=%s, voltage=%sV, altitude=%sm, rtt=%sms",
+                             telemetry.get('status'), telemetry.get('voltage'),
+                             telemetry.get('altitude'), telemetry.get('rtt_ms'))
         except Exception as e:
-            logger.error(f"Failed to emit controller telemetry: {e}")
+            logger.error("Failed to emit controller telemetry: %s", e)
 
     def is_connected(self) -> bool:
         """Check if connected to backend."""
@@ -28,13 +28,11 @@ import signal
 import sys
 import os
 import threading
-from typing import Optional, Dict, Any
+from collections import deque
+from typing import Optional, Dict, Any, List, Tuple
 
 import psutil
 
-# Add parent to path for common imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
-
 # Base pi imports
 from base_pi import config
 from base_pi.control_forwarder import ControlForwarder
@@ -44,11 +42,13 @@ from base_pi.telemetry_buffer import TelemetryBuffer
 from base_pi.telemetry_websocket import TelemetryWebSocketServer, run_websocket_server
 from base_pi.telemetry_storage import TelemetryStorage
 from base_pi.telemetry_controller import format_for_controller
+from base_pi.telemetry_publisher import TelemetryPublisher, ZMQ_AVAILABLE
 from base_pi.control_storage import ControlStorage
 # Note: Video recording moved to separate project: ~/serpent-video-recorder
 
 # Common imports
 from common.framing import SecureFramer
+from common.logging_config import CachedTimeFormatter
 from common.constants import (
     MSG_EMERGENCY_STOP, MSG_PING,
     WATCHDOG_TIMEOUT_S, HEARTBEAT_INTERVAL_S, ESTOP_CLEAR_CONFIRM
@@ -60,13 +60,29 @@ from .backend_client import BackendClient
 from .watchdog_monitor import WatchdogMonitor
 from base_pi.video.video_http_server import VideoHTTPServer
 
-# Configure logging
+# Configure logging (asctime rendered once per second, not per record)
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(CachedTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
 logging.basicConfig(
     level=getattr(logging, config.LOG_LEVEL),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    handlers=[_log_handler]
 )
 logger = logging.getLogger(__name__)
 
+# Ping interval while other commands keep the control link busy (RTT only)
+RTT_PING_INTERVAL_S = 1.0
+
+# Watchdog safety check / status line cadence
+WATCHDOG_CHECK_INTERVAL_S = 1.0
+
+# Telemetry samples waiting for fan-out (oldest dropped beyond this)
+TELEMETRY_FANOUT_QUEUE_MAX = 256
+
+# Operator E-STOP command data; fixed, so the forwarder's payload encoding
+# for them is always a cache hit (only seq, timestamp and HMAC vary)
+_ESTOP_ENGAGE_DATA = {'engage': True, 'reason': 'operator_toggle'}
+_ESTOP_CLEAR_DATA = {'engage': False, 'confirm_clear': ESTOP_CLEAR_CONFIRM, 'reason': 'operator_toggle'}
+
 
 class HaLowBridge:
     """
@@ -119,7 +135,7 @@ class HaLowBridge:
         self.telemetry_buffer: Optional[TelemetryBuffer] = None
         if config.DASHBOARD_ENABLED:
             self.telemetry_buffer = TelemetryBuffer(max_samples=config.TELEMETRY_BUFFER_SIZE)
-            logger.info(f"Telemetry buffer initialized (size: {config.TELEMETRY_BUFFER_SIZE})")
+            logger.info("Telemetry buffer initialized (size: %s)", config.TELEMETRY_BUFFER_SIZE)
 
         # WebSocket server for dashboard
         self.websocket_server: Optional[TelemetryWebSocketServer] = None
@@ -135,12 +151,28 @@ class HaLowBridge:
                 retention_days=config.TELEMETRY_RETENTION_DAYS
             )
 
+        # ZeroMQ telemetry publisher (replaces Socket.IO telemetry emits)
+        self.telemetry_publisher: Optional[TelemetryPublisher] = None
+        if config.TELEMETRY_PUB_PORT:
+            if ZMQ_AVAILABLE:
+                self.telemetry_publisher = TelemetryPublisher(
+                    port=config.TELEMETRY_PUB_PORT,
+                    send_hwm=config.TELEMETRY_PUB_HWM
+                )
+            else:
+                logger.warning("TELEMETRY_PUB_PORT set but pyzmq not installed - using Socket.IO telemetry")
+
         # Backend client
         self.backend_client = BackendClient(
             backend_url=config.BACKEND_SOCKETIO_URL,
             on_connection_change=self._on_backend_connection_change,
             on_command=self._on_backend_command,
-            on_emergency_status=self._on_emergency_status
+            on_emergency_status=self._on_emergency_status,
+            telemetry_emit_interval=config.TELEMETRY_EMIT_INTERVAL_S,
+            telemetry_batched=config.TELEMETRY_EMIT_BATCHED,
+            telemetry_msgpack=config.TELEMETRY_EMIT_MSGPACK,
+            telemetry_latest_only=config.TELEMETRY_EMIT_LATEST_ONLY,
+            command_dedup_window=config.COMMAND_DEDUP_WINDOW_S
         )
 
         # Watchdog monitor
@@ -154,11 +186,22 @@ class HaLowBridge:
         self.http_server: Optional[VideoHTTPServer] = None
         self.http_thread: Optional[threading.Thread] = None
 
-        # Heartbeat thread
-        self.heartbeat_thread: Optional[threading.Thread] = None
+        # Telemetry fan-out (buffer, dashboard, storage, backend) runs on its
+        # own worker so slow consumers never stall the telemetry receiver.
+        # Single-producer/single-consumer ring: deque append/popleft are atomic
+        # and maxlen drops the oldest sample on overflow.
+        self._fanout_ring: deque = deque(maxlen=TELEMETRY_FANOUT_QUEUE_MAX)
+        self._fanout_wake = threading.Event()
+        self._fanout_stop = False
+        self._fanout_thread: Optional[threading.Thread] = None
+
+        # Controller telemetry is emitted on its own timer from the latest sample
+        self._latest_telemetry: Optional[Dict[str, Any]] = None
+        self.controller_telemetry_thread: Optional[threading.Thread] = None
 
-        # Running flag
+        # Running flag, plus an event so stop() wakes the loops immediately
         self.running = False
+        self._stop_evt = threading.Event()
 
         logger.info("HaLowBridge initialized (modular architecture)")
 
@@ -193,20 +236,13 @@ class HaLowBridge:
 
         # Send E-STOP command to robot
         if active:
-            logger.warning(f"E-STOP ENGAGE: sending to robot (source={source})")
-            success = self.control_forwarder.send_command(MSG_EMERGENCY_STOP, {
-                'engage': True,
-                'reason': 'operator_toggle'
-            })
+            logger.warning("E-STOP ENGAGE: sending to robot (source=%s)", source)
+            success = self.control_forwarder.send_command(MSG_EMERGENCY_STOP, _ESTOP_ENGAGE_DATA)
             if not success:
                 logger.error("E-STOP ENGAGE command failed to send!")
         else:
-            logger.info(f"E-STOP CLEAR: sending to robot (source={source})")
-            success = self.control_forwarder.send_command(MSG_EMERGENCY_STOP, {
-                'engage': False,
-                'confirm_clear': ESTOP_CLEAR_CONFIRM,
-                'reason': 'operator_toggle'
-            })
+            logger.info("E-STOP CLEAR: sending to robot (source=%s)", source)
+            success = self.control_forwarder.send_command(MSG_EMERGENCY_STOP, _ESTOP_CLEAR_DATA)
             if not success:
                 logger.error("E-STOP CLEAR command failed to send!")
 
@@ -239,71 +275,177 @@ class HaLowBridge:
             self.control_storage.write_command(command_type, data, success)
 
     def _on_telemetry_received(self, telemetry: Dict[str, Any]):
-        """Callback when telemetry is received from Robot Pi."""
-        # Extract E-STOP state (both engaged flag and reason)
-        estop_info = telemetry.get('estop', {})
-        estop_engaged = estop_info.get('engaged')
-        self.state.update_estop_state(estop_engaged, estop_info.get('reason'))
+        """
+        Callback when telemetry is received from Robot Pi.
+
+        Runs on the telemetry receiver thread and never waits on a consumer:
+        E-STOP and RTT state are updated inline, everything else is handed to
+        the fan-out worker through a bounded ring (oldest dropped).
+        """
+        # Extract E-STOP state (both engaged flag and reason); no default {}
+        # per sample when the section is missing
+        estop_info = telemetry.get('estop')
+        if estop_info:
+            estop_engaged = estop_info.get('engaged')
+            estop_reason = estop_info.get('reason')
+        else:
+            estop_engaged = estop_reason = None
+        self.state.update_estop_state(estop_engaged, estop_reason)
 
         # If robot confirms it is still engaged, sync BackendClient dedup so a
         # failed clear (e.g. robot rejected due to stale control) can be retried.
         if estop_engaged is True:
             self.backend_client.sync_estop_engaged()
 
-        # Compute RTT from pong data if present
+        # Compute RTT from pong data if present (clock read once, only for pongs)
         pong = telemetry.get('pong')
         if pong:
-            self.state.update_rtt(pong.get('ping_seq'), pong.get('ping_ts', time.time()))
+            self.state.update_rtt(pong.get('ping_seq'), pong.get('ping_ts'), now=time.monotonic())
 
         # Include RTT in telemetry for backend
         telemetry['rtt_ms'] = self.state.get_rtt()
 
-        # Attach Base Pi CPU stats
-        telemetry['base_cpu'] = self._read_cpu_stats()
-
-        # Add to telemetry buffer
-        if self.telemetry_buffer:
-            self.telemetry_buffer.add_sample(telemetry)
+        # Hand off to the fan-out worker (oldest sample dropped if it lags)
+        self._fanout_ring.append(telemetry)
+        if not self._fanout_wake.is_set():
+            self._fanout_wake.set()
+
+    def _fanout_worker(self):
+        """Deliver queued telemetry to buffer, dashboard, storage and backend."""
+        ring = self._fanout_ring
+        while True:
+            self._fanout_wake.wait()
+            # Clear before draining so an append racing the drain re-arms the wake
+            self._fanout_wake.clear()
+
+            # Take everything that queued up since the last pass
+            batch = []
+            try:
+                while True:
+                    batch.append(ring.popleft())
+            except IndexError:
+                pass
 
-        # Broadcast to WebSocket clients (dashboard)
-        if self.websocket_server:
-            self.websocket_server.broadcast_telemetry_sync(telemetry)
+            try:
+                if batch:
+                    self._fanout_telemetry(batch)
+            except Exception as e:
+                logger.error("Telemetry fan-out error: %s", e)
 
-        # Store telemetry to database
-        if self.telemetry_storage:
-            self.telemetry_storage.write_telemetry(telemetry)
+            if self._fanout_stop:
+                break
 
-        # Forward full telemetry to backend via Socket.IO
-        if self.state.is_backend_connected():
-            self.backend_client.emit_telemetry(telemetry)
+    def _fanout_telemetry(self, batch: List[Dict[str, Any]]):
+        """
+        Deliver a batch of telemetry samples (oldest first) to all consumers.
 
-        # Rate-limited controller telemetry
-        if self.state.should_send_controller_update(config.CONTROLLER_TELEMETRY_RATE_HZ):
-            controller_data = format_for_controller(telemetry)
-            if self.state.is_backend_connected():
-                self.backend_client.emit_controller_telemetry(controller_data)
-            else:
-                logger.debug("Controller telemetry not sent - backend disconnected")
+        Every consumer only enqueues (storage writer thread, WebSocket event
+        loop, ZeroMQ send queue, Socket.IO emit window), so a slow disk or
+        client never holds up this worker, let alone the receiver thread.
+        """
+        cpu_stats = self._read_cpu_stats()
+
+        # Resolve consumers once per batch rather than per sample
+        buffer = self.telemetry_buffer
+        websocket_server = self.websocket_server
+        if websocket_server and not websocket_server.clients:
+            websocket_server = None
+        storage = self.telemetry_storage
+        publisher = self.telemetry_publisher
+
+        for telemetry in batch:
+            # Attach Base Pi CPU stats
+            telemetry['base_cpu'] = cpu_stats
+
+            # Add to telemetry buffer
+            if buffer:
+                buffer.add_sample(telemetry)
+
+            # Broadcast to WebSocket clients (dashboard). The buffer encodes the
+            # sample it just stored once, and /api/telemetry/latest polls are
+            # served from the same bytes.
+            if websocket_server:
+                websocket_server.broadcast_encoded_sync(buffer.get_latest_json())
+
+            # Store telemetry to database
+            if storage:
+                storage.write_telemetry(telemetry)
+
+            # Forward full telemetry to backend via ZeroMQ PUB
+            if publisher:
+                publisher.publish(telemetry)
+
+        # Otherwise hand the whole batch to the Socket.IO emit window
+        if not self.telemetry_publisher and self.state.is_backend_connected():
+            self.backend_client.emit_telemetry_batch(batch)
+
+        # Latest sample for the controller telemetry timer
+        self._latest_telemetry = batch[-1]
+
+    def _controller_telemetry_loop(self):
+        """Emit the latest telemetry to the controller at CONTROLLER_TELEMETRY_RATE_HZ."""
+        rate_hz = config.CONTROLLER_TELEMETRY_RATE_HZ
+        interval = 1.0 / rate_hz if rate_hz > 0 else 1.0
+        last_sent = None
+        next_tick = time.monotonic() + interval
+        while not self._stop_evt.wait(max(0.0, next_tick - time.monotonic())):
+            next_tick = max(next_tick + interval, time.monotonic())
+
+            # Only new samples: never re-send stale telemetry as if it were live
+            telemetry = self._latest_telemetry
+            if telemetry is None or telemetry is last_sent:
+                continue
+            last_sent = telemetry
 
-    def _heartbeat_loop(self):
-        """Send periodic pings to Robot Pi for RTT measurement."""
-        while self.running:
             try:
-                if self.control_forwarder.is_connected():
-                    ping_seq = self.state.get_next_ping_seq()
-                    ping_time = time.time()
-                    self.state.update_ping_sent(ping_seq, ping_time)
+                if self.state.is_backend_connected():
+                    self.backend_client.emit_controller_telemetry(format_for_controller(telemetry))
+                else:
+                    logger.debug("Controller telemetry not sent - backend disconnected")
+            except Exception as e:
+                logger.error("Controller telemetry error: %s", e)
 
-                    self.control_forwarder.send_command(MSG_PING, {
-                        'ts': ping_time,
-                        'seq': ping_seq
-                    })
+    def _heartbeat_tick(self, last_ping: float) -> Tuple[float, float]:
+        """
+        Send a ping to Robot Pi for liveness and RTT measurement, if one is due.
 
-                time.sleep(HEARTBEAT_INTERVAL_S)
+        While the link is idle, pings go out every HEARTBEAT_INTERVAL_S so the
+        robot watchdog always sees traffic. While other commands are flowing
+        they already keep the link alive, so pings drop to RTT_PING_INTERVAL_S
+        (just enough to keep the RTT reading fresh).
 
-            except Exception as e:
-                logger.error(f"Heartbeat error: {e}")
-                time.sleep(1.0)
+        Args:
+            last_ping: time.monotonic() of the last ping sent
+
+        Returns:
+            (last_ping, seconds until the next heartbeat check)
+        """
+        try:
+            if not self.control_forwarder.is_connected():
+                return last_ping, HEARTBEAT_INTERVAL_S
+
+            now = time.monotonic()
+            idle_for = now - self.control_forwarder.get_last_send_time()
+            since_ping = now - last_ping
+            if idle_for < HEARTBEAT_INTERVAL_S and since_ping < RTT_PING_INTERVAL_S:
+                # Other traffic is keeping the link alive; wake when either is due
+                return last_ping, min(HEARTBEAT_INTERVAL_S - idle_for, RTT_PING_INTERVAL_S - since_ping)
+
+            ping_seq = self.state.get_next_ping_seq()
+            # Monotonic: the robot echoes 'ts' back verbatim, it never
+            # compares it with its own clock
+            ping_time = time.monotonic()
+            self.state.update_ping_sent(ping_seq, ping_time)
+
+            self.control_forwarder.send_command(MSG_PING, {
+                'ts': ping_time,
+                'seq': ping_seq
+            })
+            return now, HEARTBEAT_INTERVAL_S
+
+        except Exception as e:
+            logger.error("Heartbeat error: %s", e)
+            return last_ping, 1.0
 
     def _start_video_http_server(self):
         """Start the Video HTTP server in a background thread."""
@@ -321,15 +463,20 @@ class HaLowBridge:
             )
             self.http_thread.start()
         except Exception as e:
-            logger.error(f"Failed to start Video HTTP server: {e}")
+            logger.error("Failed to start Video HTTP server: %s", e)
 
     def start(self):
         """Start the bridge."""
         self.running = True
+        self._stop_evt.clear()
 
         # Start components
         logger.info("Starting components...")
 
+        self._fanout_stop = False
+        self._fanout_thread = threading.Thread(target=self._fanout_worker, daemon=True)
+        self._fanout_thread.start()
+
         self.control_forwarder.start()
         self.telemetry_receiver.start()
 
@@ -358,71 +505,101 @@ class HaLowBridge:
                 daemon=True
             )
             self.websocket_thread.start()
-            logger.info(f"WebSocket server starting on port {config.DASHBOARD_WS_PORT}")
+            logger.info("WebSocket server starting on port %s", config.DASHBOARD_WS_PORT)
 
         # Start Video HTTP server for MJPEG streaming
         if config.VIDEO_HTTP_ENABLED:
             self._start_video_http_server()
 
-        # Start heartbeat thread
-        self.heartbeat_thread = threading.Thread(target=self._heartbeat_loop, daemon=True)
-        self.heartbeat_thread.start()
+        # Start controller telemetry timer
+        self.controller_telemetry_thread = threading.Thread(
+            target=self._controller_telemetry_loop,
+            daemon=True
+        )
+        self.controller_telemetry_thread.start()
 
         # Connect to backend
         self.backend_client.connect()
 
         logger.info("HaLowBridge started successfully")
 
-        # Watchdog loop (runs in main thread)
-        self._watchdog_loop()
+        # Heartbeat + watchdog loop (runs in main thread)
+        self._main_loop()
 
-    def _watchdog_loop(self):
+    def _main_loop(self):
+        """
+        Run the heartbeat and the watchdog on one thread.
+
+        Each keeps its own time.monotonic() deadline; the loop sleeps until
+        the earlier one (or until stop()).
+        """
+        last_ping = 0.0
+        now = time.monotonic()
+        next_heartbeat = now
+        next_watchdog = now + WATCHDOG_CHECK_INTERVAL_S
+        delay = 0.0
+        while not self._stop_evt.wait(delay):
+            now = time.monotonic()
+            if now >= next_heartbeat:
+                last_ping, heartbeat_delay = self._heartbeat_tick(last_ping)
+                next_heartbeat = now + heartbeat_delay
+            if now >= next_watchdog:
+                self._watchdog_tick()
+                next_watchdog = now + WATCHDOG_CHECK_INTERVAL_S
+            delay = max(0.0, min(next_heartbeat, next_watchdog) - time.monotonic())
+
+    def _watchdog_tick(self):
         """Monitor connection health and trigger E-STOP if needed."""
-        while self.running:
-            try:
-                time.sleep(1.0)
-
-                # Check safety conditions
-                self.watchdog.check_safety()
-
-                # Get latest sensor data from telemetry buffer
-                sensor_data = None
-                if self.telemetry_buffer:
-                    latest_telemetry = self.telemetry_buffer.get_latest()
-                    if latest_telemetry:
-                        sensor_data = {}
-                        if 'imu' in latest_telemetry:
-                            sensor_data['imu'] = latest_telemetry['imu']
-                        if 'barometer' in latest_telemetry:
-                            sensor_data['barometer'] = latest_telemetry['barometer']
-                        if 'robot_cpu' in latest_telemetry:
-                            sensor_data['robot_cpu'] = latest_telemetry['robot_cpu']
-                        if 'base_cpu' in latest_telemetry:
-                            sensor_data['base_cpu'] = latest_telemetry['base_cpu']
-
-                # Log status periodically
-                self.watchdog.log_status(
-                    backend_connected=self.state.is_backend_connected(),
-                    control_connected=self.control_forwarder.is_connected(),
-                    telemetry_connected=self.telemetry_receiver.is_connected(),
-                    video_connected=self.video_receiver.is_connected() if self.video_receiver else False,
-                    robot_estop_state=self.state.get_estop_state(),
-                    psk_valid=self.framer.is_authenticated(),
-                    robot_estop_reason=self.state.get_estop_reason(),
-                    sensor_data=sensor_data
-                )
+        try:
+            # Check safety conditions
+            self.watchdog.check_safety()
+
+            # Only gather status inputs when a status line is due
+            if not self.watchdog.status_due():
+                return
+
+            # Get latest sensor data from telemetry buffer
+            sensor_data = None
+            if self.telemetry_buffer:
+                latest_telemetry = self.telemetry_buffer.get_latest()
+                if latest_telemetry:
+                    sensor_data = {}
+                    if 'imu' in latest_telemetry:
+                        sensor_data['imu'] = latest_telemetry['imu']
+                    if 'barometer' in latest_telemetry:
+                        sensor_data['barometer'] = latest_telemetry['barometer']
+                    if 'robot_cpu' in latest_telemetry:
+                        sensor_data['robot_cpu'] = latest_telemetry['robot_cpu']
+                    if 'base_cpu' in latest_telemetry:
+                        sensor_data['base_cpu'] = latest_telemetry['base_cpu']
+
+            # Log status periodically
+            self.watchdog.log_status(
+                backend_connected=self.state.is_backend_connected(),
+                control_connected=self.control_forwarder.is_connected(),
+                telemetry_connected=self.telemetry_receiver.is_connected(),
+                video_connected=self.video_receiver.is_connected() if self.video_receiver else False,
+                robot_estop_state=self.state.get_estop_state(),
+                psk_valid=self.framer.is_authenticated(),
+                robot_estop_reason=self.state.get_estop_reason(),
+                sensor_data=sensor_data
+            )
 
-            except Exception as e:
-                logger.error(f"Error in watchdog loop: {e}")
+        except Exception as e:
+            logger.error("Error in watchdog loop: %s", e)
 
     def stop(self):
         """Stop the bridge."""
         logger.info("Stopping HaLowBridge...")
         self.running = False
+        self._stop_evt.set()
 
         # Disconnect from backend
         self.backend_client.disconnect()
 
+        if self.telemetry_publisher:
+            self.telemetry_publisher.close()
+
         # Stop storage
         if self.telemetry_storage:
             self.telemetry_storage.stop()
@@ -441,6 +618,13 @@ class HaLowBridge:
         if self.video_receiver:
             self.video_receiver.stop()
 
+        # Stop fan-out worker (after the receiver, so nothing new is queued)
+        if self._fanout_thread:
+            self._fanout_stop = True
+            self._fanout_wake.set()
+            self._fanout_thread.join(timeout=2.0)
+            self._fanout_thread = None
+
         logger.info("HaLowBridge stopped")
 
     def get_health(self) -> dict:
@@ -448,7 +632,7 @@ class HaLowBridge:
         last_telemetry_time = self.telemetry_receiver.get_last_telemetry_time()
         last_telemetry_age = None
         if last_telemetry_time > 0:
-            last_telemetry_age = time.time() - last_telemetry_time
+            last_telemetry_age = time.monotonic() - last_telemetry_time
 
         return self.state.get_health_status(
             control_connected=self.control_forwarder.is_connected(),
@@ -490,7 +674,7 @@ def main():
     try:
         bridge.start()
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
+        logger.error("Fatal error: %s", e)
         if bridge:
             bridge.stop()
         sys.exit(1)
@@ -9,12 +9,46 @@ Manages bridge state including:
 - Controller telemetry rate limiting
 """
 
+import itertools
 import logging
+import threading
 import time
 from typing import Optional, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# E-STOP command labels for logs, indexed by bool(active)
+_ESTOP_LABELS = ('CLEAR', 'ENGAGE')
+
+def _telemetry_age_level(last_telemetry_age: float, watchdog_timeout: float) -> int:
+    """Classify telemetry age: 0 = fresh, 1 = late (> timeout/2), 2 = stale (> timeout)."""
+    if last_telemetry_age > watchdog_timeout:
+        return 2
+    if last_telemetry_age > watchdog_timeout / 2:
+        return 1
+    return 0
+
+
+# Health penalty for each connection/PSK combination, indexed by
+# (psk_valid << 3) | (control << 2) | (telemetry << 1) | video
+_CONNECTION_PENALTY = tuple(
+    (0 if mask & 8 else 50) +   # Critical: PSK validation
+    (0 if mask & 4 else 20) +   # Control connection
+    (0 if mask & 2 else 20) +   # Telemetry connection
+    (0 if mask & 1 else 10)     # Video connection
+    for mask in range(16)
+)
+
+# Health penalty by telemetry age level (fresh, late, stale)
+_AGE_PENALTY = (0, 10, 30)
+
+
+def _health_score(control_connected: bool, telemetry_connected: bool,
+                  video_connected: bool, age_level: int, psk_valid: bool) -> int:
+    """Health score (0-100) from connection flags and telemetry age level."""
+    mask = (psk_valid << 3) | (control_connected << 2) | (telemetry_connected << 1) | video_connected
+    return max(0, 100 - _CONNECTION_PENALTY[mask] - _AGE_PENALTY[age_level])
+
 
 class StateManager:
     """
@@ -24,6 +58,15 @@ class StateManager:
     health scoring for monitoring.
     """
 
+    __slots__ = (
+        'active_camera_id', 'backend_connected',
+        'last_robot_estop_state', 'last_robot_estop_reason',
+        'last_rtt_ms', 'last_ping_time', 'last_ping_seq', '_ping_counter',
+        '_last_emergency_status_time', '_last_emergency_command_sent',
+        '_emergency_debounce_s', '_emergency_event_id', '_estop_lock',
+        '_last_status_key', '_last_status',
+    )
+
     def __init__(self, default_camera_id: int = 0):
         """
         Initialize state manager.
@@ -37,24 +80,31 @@ class StateManager:
         self.last_robot_estop_state: Optional[bool] = None
         self.last_robot_estop_reason: Optional[str] = None
         self.last_rtt_ms = 0
-        self.last_controller_update = 0.0
 
         # Heartbeat state for RTT measurement
         self.last_ping_time = 0
         self.last_ping_seq = 0
+        self._ping_counter = itertools.count(1)  # next() is atomic under the GIL
 
         # E-STOP deduplication state (prevent multiple commands for same logical event)
         self._last_emergency_status_time = 0.0
         self._last_emergency_command_sent: Optional[bool] = None  # Last command we SENT to robot
         self._emergency_debounce_s = 1.0  # Ignore events within 1 second
         self._emergency_event_id: int = 0  # Increments on each unique event
+        # Guards the compare-and-set on _last_emergency_command_sent (called from
+        # the backend event loop, telemetry receiver and watchdog threads)
+        self._estop_lock = threading.Lock()
+
+        # get_health_status() cache (inputs key -> status dict)
+        self._last_status_key: Optional[tuple] = None
+        self._last_status: Dict[str, Any] = {}
 
-        logger.info(f"StateManager initialized (camera_id={default_camera_id})")
+        logger.info("StateManager initialized (camera_id=%s)", default_camera_id)
 
     def set_backend_connected(self, connected: bool):
         """Set backend connection state."""
         if connected != self.backend_connected:
-            logger.info(f"Backend connection state changed: {connected}")
+            logger.info("Backend connection state changed: %s", connected)
         self.backend_connected = connected
 
     def is_backend_connected(self) -> bool:
@@ -63,7 +113,7 @@ class StateManager:
 
     def set_camera_id(self, camera_id: int):
         """Set active camera ID."""
-        logger.info(f"Active camera changed: {self.active_camera_id} -> {camera_id}")
+        logger.info("Active camera changed: %s -> %s", self.active_camera_id, camera_id)
         self.active_camera_id = camera_id
 
     def get_camera_id(self) -> int:
@@ -79,7 +129,8 @@ class StateManager:
             reason: E-STOP reason string from Robot Pi (e.g. 'boot_default', 'watchdog')
         """
         if engaged != self.last_robot_estop_state:
-            logger.info(f"Robot E-STOP state changed: {self.last_robot_estop_state} -> {engaged} (reason: {reason})")
+            logger.info("Robot E-STOP state changed: %s -> %s (reason: %s)",
+                        self.last_robot_estop_state, engaged, reason)
         self.last_robot_estop_state = engaged
         if reason is not None:
             self.last_robot_estop_reason = reason
@@ -88,8 +139,12 @@ class StateManager:
         # recorded a clear as sent, the robot rejected that clear (e.g. stale
         # control age). Reset so the next clear attempt is not blocked.
         if engaged is True and self._last_emergency_command_sent is False:
-            logger.info("E-STOP dedup sync: robot confirms engaged after clear attempt — allowing retry")
-            self._last_emergency_command_sent = True
+            with self._estop_lock:
+                resync = self._last_emergency_command_sent is False
+                if resync:
+                    self._last_emergency_command_sent = True
+            if resync:
+                logger.info("E-STOP dedup sync: robot confirms engaged after clear attempt — allowing retry")
 
     def get_estop_state(self) -> Optional[bool]:
         """Get last known E-STOP state from Robot Pi."""
@@ -99,29 +154,36 @@ class StateManager:
         """Get last known E-STOP reason from Robot Pi."""
         return self.last_robot_estop_reason
 
-    def update_rtt(self, ping_seq: int, ping_ts: float) -> Optional[int]:
+    def update_rtt(self, ping_seq: int, ping_ts: Optional[float] = None,
+                   now: Optional[float] = None) -> Optional[int]:
         """
         Update RTT measurement from pong data.
 
         Args:
             ping_seq: Ping sequence number from pong
-            ping_ts: Original ping timestamp from pong
+            ping_ts: Original ping time.monotonic() timestamp echoed in the pong
+                (None = use our recorded send time)
+            now: Current time.monotonic() if the caller already has it
 
         Returns:
             RTT in milliseconds if valid, None otherwise
         """
-        if ping_seq == self.last_ping_seq and self.last_ping_time > 0:
-            now = time.time()
-            rtt_ms = int((now - ping_ts) * 1000)
-
-            # Sanity check: 0-10 second range
-            if 0 <= rtt_ms < 10000:
-                self.last_rtt_ms = rtt_ms
-                logger.debug(f"RTT measured: {rtt_ms}ms (ping_seq={ping_seq})")
-                return rtt_ms
-            else:
-                logger.warning(f"RTT out of range: {rtt_ms}ms, ignoring")
-        return None
+        last_ping_time = self.last_ping_time
+        if ping_seq != self.last_ping_seq or last_ping_time <= 0:
+            return None
+
+        if now is None:
+            now = time.monotonic()
+        rtt_ms = int((now - (last_ping_time if ping_ts is None else ping_ts)) * 1000)
+
+        # Sanity check: 0-10 second range
+        if not 0 <= rtt_ms < 10000:
+            logger.warning("RTT out of range: %dms, ignoring", rtt_ms)
+            return None
+
+        self.last_rtt_ms = rtt_ms
+        logger.debug("RTT measured: %dms (ping_seq=%s)", rtt_ms, ping_seq)
+        return rtt_ms
 
     def get_rtt(self) -> int:
         """Get last measured RTT in milliseconds."""
@@ -133,33 +195,16 @@ class StateManager:
 
         Args:
             seq: Ping sequence number
-            timestamp: Ping send timestamp
+            timestamp: Ping send time (time.monotonic())
         """
         self.last_ping_seq = seq
         self.last_ping_time = timestamp
 
     def get_next_ping_seq(self) -> int:
         """Get next ping sequence number."""
-        self.last_ping_seq += 1
-        return self.last_ping_seq
-
-    def should_send_controller_update(self, rate_hz: float) -> bool:
-        """
-        Check if controller telemetry update should be sent.
-
-        Args:
-            rate_hz: Target update rate in Hz
-
-        Returns:
-            True if update should be sent
-        """
-        now = time.time()
-        interval = 1.0 / rate_hz if rate_hz > 0 else 1.0
-
-        if now - self.last_controller_update >= interval:
-            self.last_controller_update = now
-            return True
-        return False
+        seq = next(self._ping_counter)
+        self.last_ping_seq = seq
+        return seq
 
     def should_send_emergency_command(self, active: bool, source: str) -> bool:
         """
@@ -175,16 +220,20 @@ class StateManager:
         Returns:
             True if command should be sent to robot
         """
-        # Simple state-based dedup: don't send if we already sent the same command
-        if self._last_emergency_command_sent == active:
-            logger.debug(f"E-STOP: ignoring duplicate {'ENGAGE' if active else 'CLEAR'} from {source}")
+        # Simple state-based dedup: don't send if we already sent the same command.
+        # Compare and set atomically so two threads can't both send the same command.
+        with self._estop_lock:
+            duplicate = self._last_emergency_command_sent == active
+            if not duplicate:
+                # New command - allow it
+                self._last_emergency_command_sent = active
+                self._emergency_event_id += 1
+
+        if duplicate:
+            logger.debug("E-STOP: ignoring duplicate %s from %s", _ESTOP_LABELS[bool(active)], source)
             return False
 
-        # New command - allow it
-        self._last_emergency_command_sent = active
-        self._emergency_event_id += 1
-
-        logger.info(f"E-STOP: forwarding {'ENGAGE' if active else 'CLEAR'} from {source}")
+        logger.info("E-STOP: forwarding %s from %s", _ESTOP_LABELS[bool(active)], source)
         return True
 
     def get_last_emergency_command(self) -> Optional[bool]:
@@ -193,8 +242,9 @@ class StateManager:
 
     def reset_emergency_state(self):
         """Reset emergency state tracking (e.g. on reconnect)."""
-        self._last_emergency_command_sent = None
-        self._last_emergency_status_time = 0.0
+        with self._estop_lock:
+            self._last_emergency_command_sent = None
+            self._last_emergency_status_time = 0.0
         logger.info("E-STOP state tracking reset")
 
     def compute_health_score(
@@ -220,28 +270,62 @@ class StateManager:
         Returns:
             Health score (0-100)
         """
-        score = 100
-
-        # Critical: PSK validation
-        if not psk_valid:
-            score -= 50
+        age_level = _telemetry_age_level(last_telemetry_age, watchdog_timeout) if last_telemetry_age > 0 else 0
+        return _health_score(
+            bool(control_connected), bool(telemetry_connected), bool(video_connected),
+            age_level, bool(psk_valid)
+        )
 
-        # Connection states
-        if not control_connected:
-            score -= 20
-        if not telemetry_connected:
-            score -= 20
-        if not video_connected:
-            score -= 10
+    def _status_base(
+        self,
+        control_connected: bool,
+        telemetry_connected: bool,
+        video_connected: bool,
+        last_telemetry_age: Optional[float],
+        watchdog_timeout: float,
+        psk_valid: bool
+    ) -> Dict[str, Any]:
+        """
+        Get the cached slow-changing part of the health status.
 
-        # Telemetry freshness
-        if last_telemetry_age > 0:
-            if last_telemetry_age > watchdog_timeout:
-                score -= 30
-            elif last_telemetry_age > watchdog_timeout / 2:
-                score -= 10
+        Everything except telemetry age and RTT changes rarely: the dict is
+        rebuilt only when one of those inputs changes. Callers must not modify the returned dict.
+        """
+        telem_age = last_telemetry_age if last_telemetry_age is not None else 0
+        age_level = _telemetry_age_level(telem_age, watchdog_timeout) if telem_age > 0 else 0
 
-        return max(0, score)
+        key = (
+            bool(control_connected), bool(telemetry_connected), bool(video_connected),
+            age_level, bool(psk_valid), self.backend_connected,
+            self.last_robot_estop_state, self.active_camera_id
+        )
+        if key != self._last_status_key:
+            control_connected, telemetry_connected, video_connected, _, psk_valid = key[:5]
+
+            # Determine if system is healthy
+            healthy = (
+                control_connected and
+                telemetry_connected and
+                psk_valid and
+                (last_telemetry_age is None or age_level < 2)
+            )
+
+            self._last_status = {
+                'status': 'ok' if healthy else 'degraded',
+                'health_score': _health_score(*key[:5]),
+                'backend_connected': self.backend_connected,
+                'control_connected': control_connected,
+                'telemetry_connected': telemetry_connected,
+                'video_connected': video_connected,
+                'robot_estop_engaged': self.last_robot_estop_state,
+                'last_telemetry_age_s': None,
+                'psk_valid': psk_valid,
+                'last_rtt_ms': 0,
+                'active_camera_id': self.active_camera_id
+            }
+            self._last_status_key = key
+
+        return self._last_status
 
     def get_health_status(
         self,
@@ -264,37 +348,14 @@ class StateManager:
             psk_valid: PSK validation state
 
         Returns:
-            Health status dictionary
+            Health status dictionary (a new dict owned by the caller; the
+            slow-changing part is built once and copied, see _status_base)
         """
-        # Determine if system is healthy
-        healthy = (
-            control_connected and
-            telemetry_connected and
-            psk_valid and
-            (last_telemetry_age is None or last_telemetry_age <= watchdog_timeout)
-        )
-
-        # Compute health score
-        telem_age = last_telemetry_age if last_telemetry_age is not None else 0
-        score = self.compute_health_score(
-            control_connected,
-            telemetry_connected,
-            video_connected,
-            telem_age,
-            watchdog_timeout,
-            psk_valid
-        )
-
-        return {
-            'status': 'ok' if healthy else 'degraded',
-            'health_score': score,
-            'backend_connected': self.backend_connected,
-            'control_connected': control_connected,
-            'telemetry_connected': telemetry_connected,
-            'video_connected': video_connected,
-            'robot_estop_engaged': self.last_robot_estop_state,
-            'last_telemetry_age_s': last_telemetry_age,
-            'psk_valid': psk_valid,
-            'last_rtt_ms': self.last_rtt_ms,
-            'active_camera_id': self.active_camera_id
-        }
+        # Fresh copy per call; only the volatile fields differ
+        status = dict(self._status_base(
+            control_connected, telemetry_connected, video_connected,
+            last_telemetry_age, watchdog_timeout, psk_valid
+        ))
+        status['last_telemetry_age_s'] = last_telemetry_age
+        status['last_rtt_ms'] = self.last_rtt_ms
+        return status
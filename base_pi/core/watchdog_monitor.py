@@ -11,13 +11,20 @@ SAFETY:
 
 import logging
 import time
-import json
 from typing import Callable, Optional
 
 from common.constants import MSG_EMERGENCY_STOP, WATCHDOG_TIMEOUT_S
+from common.json_codec import dumps_bytes
 
 logger = logging.getLogger(__name__)
 
+# Connection state labels, indexed by the connected flag
+_LINK_STATE = ('disconnected', 'connected')
+_VIDEO_STATE = ('N/A', 'connected')
+
+# Telemetry sections copied into the status line when present
+_SENSOR_KEYS = ('imu', 'barometer', 'robot_cpu', 'base_cpu')
+
 
 class WatchdogMonitor:
     """
@@ -26,6 +33,13 @@ class WatchdogMonitor:
     SAFETY: Can only ENGAGE E-STOP, never clear it.
     """
 
+    __slots__ = (
+        'on_estop_engage', 'get_last_telemetry_time',
+        'status_interval', '_status_interval_ns',
+        'last_status_log', 'estop_sent_for_timeout',
+        '_last_status_key', '_last_status_head', '_sensors_scratch',
+    )
+
     def __init__(
         self,
         on_estop_engage: Callable[[str, str], None],
@@ -37,19 +51,25 @@ class WatchdogMonitor:
 
         Args:
             on_estop_engage: Callback to engage E-STOP (cmd_type, data)
-            get_last_telemetry_time: Callback to get last telemetry timestamp
+            get_last_telemetry_time: Callback to get last telemetry time.monotonic()
             status_interval: Status logging interval in seconds
         """
         self.on_estop_engage = on_estop_engage
         self.get_last_telemetry_time = get_last_telemetry_time
         self.status_interval = status_interval
+        self._status_interval_ns = int(status_interval * 1e9)
 
-        # State
-        self.last_status_log = time.time()
+        # State (time.monotonic_ns() of the last status line)
+        self.last_status_log = time.monotonic_ns()
         self.estop_sent_for_timeout = False
 
-        logger.info(f"WatchdogMonitor initialized (timeout={WATCHDOG_TIMEOUT_S}s, "
-                   f"status_interval={status_interval}s)")
+        # Status line JSON (without the closing brace) for the last link state
+        self._last_status_key: Optional[tuple] = None
+        self._last_status_head = ''
+        self._sensors_scratch: dict = {}
+
+        logger.info("WatchdogMonitor initialized (timeout=%ss, status_interval=%ss)",
+                    WATCHDOG_TIMEOUT_S, status_interval)
 
     def check_safety(self):
         """
@@ -60,9 +80,17 @@ class WatchdogMonitor:
         """
         # DISABLED: Auto E-STOP on telemetry timeout
         # E-STOP should only come from controller → backend → robot
-        # This watchdog just monitors, does not engage E-STOP
+        # This watchdog just monitors, does not engage E-STOP.
+        # get_last_telemetry_time is deliberately not read here while disabled;
+        # if auto-engage returns, read it fresh each tick - a cached telemetry
+        # time would delay a timeout E-STOP by up to the cache lifetime.
         pass
 
+    def status_due(self) -> bool:
+        """Check whether log_status() would log now (lets callers skip building its inputs)."""
+        return (logger.isEnabledFor(logging.INFO) and
+                time.monotonic_ns() - self.last_status_log > self._status_interval_ns)
+
     def log_status(
         self,
         backend_connected: bool,
@@ -87,31 +115,41 @@ class WatchdogMonitor:
             robot_estop_reason: Robot E-STOP reason string (from telemetry)
             sensor_data: Sensor data from telemetry (IMU, barometer)
         """
-        now = time.time()
+        now = time.monotonic_ns()
 
         # Log status at configured interval
-        if now - self.last_status_log > self.status_interval:
-            status = {
-                "event": "status",
-                "backend": "connected" if backend_connected else "disconnected",
-                "control": "connected" if control_connected else "disconnected",
-                "telemetry": "connected" if telemetry_connected else "disconnected",
-                "video": "connected" if video_connected else "N/A",
-                "robot_estop": robot_estop_state,
-                "robot_estop_reason": robot_estop_reason,
-                "psk_valid": psk_valid
-            }
-
-            # Include sensor data if available
+        if now - self.last_status_log > self._status_interval_ns and logger.isEnabledFor(logging.INFO):
+            # Link-state part only changes on connect/disconnect/E-STOP: re-encode
+            # it then, and reuse the cached JSON otherwise
+            key = (
+                bool(backend_connected), bool(control_connected), bool(telemetry_connected),
+                bool(video_connected), robot_estop_state, robot_estop_reason, psk_valid
+            )
+            if key != self._last_status_key:
+                status = {
+                    "event": "status",
+                    "backend": _LINK_STATE[key[0]],
+                    "control": _LINK_STATE[key[1]],
+                    "telemetry": _LINK_STATE[key[2]],
+                    "video": _VIDEO_STATE[key[3]],
+                    "robot_estop": robot_estop_state,
+                    "robot_estop_reason": robot_estop_reason,
+                    "psk_valid": psk_valid
+                }
+                self._last_status_head = dumps_bytes(status).decode('utf-8')[:-1]
+                self._last_status_key = key
+
+            # Include sensor data if available (scratch dict reused across calls;
+            # it never leaves this method)
+            sensors = self._sensors_scratch
+            sensors.clear()
             if sensor_data:
-                if 'imu' in sensor_data:
-                    status['imu'] = sensor_data['imu']
-                if 'barometer' in sensor_data:
-                    status['barometer'] = sensor_data['barometer']
-                if 'robot_cpu' in sensor_data:
-                    status['robot_cpu'] = sensor_data['robot_cpu']
-                if 'base_cpu' in sensor_data:
-                    status['base_cpu'] = sensor_data['base_cpu']
-
-            logger.info(json.dumps(status))
+                for k in _SENSOR_KEYS:
+                    if k in sensor_data:
+                        sensors[k] = sensor_data[k]
+
+            if sensors:
+                logger.info(self._last_status_head + ',' + dumps_bytes(sensors).decode('utf-8')[1:])
+            else:
+                logger.info(self._last_status_head + '}')
             self.last_status_log = now
@@ -7,9 +7,17 @@ Thread-safe access with locks for concurrent reads/writes.
 
 import threading
 import time
-from typing import Dict, List, Optional, Any
+from itertools import islice
+from typing import Dict, List, Optional, Any, Tuple
 from collections import deque
 
+from base_pi.telemetry_metrics import add_derived_metrics
+from common.json_codec import dumps_bytes
+
+# History windows (seconds) the dashboard polls; their encoded JSON is cached
+# until the next sample. Other windows are encoded on every request.
+HISTORY_CACHED_WINDOWS = frozenset((10, 60, 300))
+
 
 class TelemetryBuffer:
     """
@@ -38,6 +46,11 @@ class TelemetryBuffer:
         # Sample count
         self.sample_count = 0
 
+        # (sample_count, JSON bytes) of the latest sample with derived metrics
+        self._latest_json: Tuple[int, Optional[bytes]] = (0, None)
+        # seconds -> (sample_count, JSON bytes) for HISTORY_CACHED_WINDOWS
+        self._history_json: Dict[int, Tuple[int, bytes]] = {}
+
     def add_sample(self, telemetry: Dict[str, Any]):
         """
         Add a new telemetry sample to the buffer.
@@ -45,9 +58,12 @@ class TelemetryBuffer:
         Args:
             telemetry: Telemetry dictionary from Robot Pi
         """
+        # One private snapshot serves both history and latest: readers only
+        # ever receive copies, so nothing can mutate it after this point
+        snapshot = telemetry.copy()
         with self.lock:
-            self.telemetry_history.append(telemetry.copy())
-            self.latest_telemetry = telemetry.copy()
+            self.telemetry_history.append(snapshot)
+            self.latest_telemetry = snapshot
             self.sample_count += 1
 
     def get_latest(self) -> Optional[Dict[str, Any]]:
@@ -60,6 +76,29 @@ class TelemetryBuffer:
         with self.lock:
             return self.latest_telemetry.copy() if self.latest_telemetry else None
 
+    def get_latest_json(self) -> Optional[bytes]:
+        """
+        Get the most recent sample with derived metrics, as JSON bytes.
+
+        Encoded at most once per sample (on first read), however many
+        clients poll it.
+
+        Returns:
+            JSON bytes or None if no data
+        """
+        with self.lock:
+            latest = self.latest_telemetry
+            seq = self.sample_count
+            cached_seq, body = self._latest_json
+
+        if latest is None:
+            return None
+        if cached_seq != seq:
+            # Snapshots are never mutated, so encoding outside the lock is safe
+            body = dumps_bytes(add_derived_metrics(latest))
+            self._latest_json = (seq, body)
+        return body
+
     def get_history(self, seconds: int = 60) -> List[Dict[str, Any]]:
         """
         Get telemetry history for the last N seconds.
@@ -81,6 +120,36 @@ class TelemetryBuffer:
             history = list(self.telemetry_history)[-max_samples:]
             return [t.copy() for t in history]
 
+    def get_history_json(self, seconds: int = 60) -> bytes:
+        """
+        Get telemetry history for the last N seconds, as JSON bytes.
+
+        Same samples as get_history(); for the common dashboard windows the
+        encoding is reused until a new sample arrives.
+
+        Args:
+            seconds: Number of seconds of history to retrieve (default 60)
+
+        Returns:
+            JSON array of telemetry dicts, oldest first
+        """
+        with self.lock:
+            seq = self.sample_count
+            cached = self._history_json.get(seconds)
+            if cached is not None and cached[0] == seq:
+                return cached[1]
+
+            # Assume 10 Hz sampling
+            count = len(self.telemetry_history)
+            max_samples = max(0, min(seconds * 10, count))
+            history = list(islice(self.telemetry_history, count - max_samples, None))
+
+        # Snapshots are never mutated, so they are encoded without copying
+        body = dumps_bytes(history)
+        if seconds in HISTORY_CACHED_WINDOWS:
+            self._history_json[seconds] = (seq, body)
+        return body
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Compute statistics (min/max/avg) for key metrics.
@@ -174,3 +243,5 @@ class TelemetryBuffer:
             self.telemetry_history.clear()
             self.latest_telemetry = None
             self.sample_count = 0
+            self._latest_json = (0, None)
+            self._history_json.clear()
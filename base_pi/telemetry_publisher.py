@@ -0,0 +1,116 @@
+"""
+Telemetry Publisher Module
+
+ZeroMQ PUB socket for high-rate telemetry fan-out to the backend, bypassing
+Socket.IO's per-message framing and ack bookkeeping. Socket.IO stays in use
+for control events and controller telemetry.
+
+Each message is two frames: topic + payload. The topic names the encoding:
+- b'telemetry_mp': msgpack payload (when msgpack is installed)
+- b'telemetry':    compact JSON payload (fallback)
+"""
+
+import logging
+import threading
+from typing import Dict, Any
+
+from common.json_codec import dumps_bytes
+
+logger = logging.getLogger(__name__)
+
+ZMQ_AVAILABLE = False
+try:
+    import zmq
+    ZMQ_AVAILABLE = True
+except ImportError:
+    pass
+
+MSGPACK_AVAILABLE = False
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    pass
+
+
+class TelemetryPublisher:
+    """
+    Non-blocking ZeroMQ PUB socket for telemetry samples.
+
+    Slow or absent subscribers never block the caller: once the send
+    high-water mark is reached, new samples are dropped.
+    """
+
+    def __init__(self, port: int, send_hwm: int = 1000):
+        """
+        Initialize publisher.
+
+        Args:
+            port: TCP port to bind the PUB socket on (all interfaces)
+            send_hwm: Max messages queued per subscriber before dropping
+        """
+        if not ZMQ_AVAILABLE:
+            raise RuntimeError("pyzmq not installed - cannot publish telemetry over ZeroMQ")
+
+        self.port = port
+        self.ctx = zmq.Context.instance()
+        self.pub = self.ctx.socket(zmq.PUB)
+        self.pub.setsockopt(zmq.SNDHWM, send_hwm)
+        self.pub.setsockopt(zmq.LINGER, 0)
+        self.pub.bind(f"tcp://*:{port}")
+
+        if MSGPACK_AVAILABLE:
+            self._topic = b'telemetry_mp'
+            self._packer = msgpack.Packer(use_bin_type=True)
+        else:
+            self._topic = b'telemetry'
+            self._packer = None
+
+        # zmq sockets and msgpack Packers are not thread-safe
+        self.lock = threading.Lock()
+
+        self.messages_published = 0
+        self.messages_dropped = 0
+
+        logger.info(f"Telemetry publisher bound on tcp://*:{port} (topic={self._topic.decode()})")
+
+    def publish(self, telemetry: Dict[str, Any]) -> bool:
+        """
+        Publish one telemetry sample (never blocks).
+
+        Args:
+            telemetry: Telemetry dictionary
+
+        Returns:
+            True if queued for subscribers, False if dropped
+        """
+        with self.lock:
+            try:
+                if self._packer is not None:
+                    payload = self._packer.pack(telemetry)
+                else:
+                    payload = dumps_bytes(telemetry)
+                self.pub.send_multipart([self._topic, payload], flags=zmq.NOBLOCK)
+                self.messages_published += 1
+                return True
+            except zmq.Again:
+                self.messages_dropped += 1
+                return False
+            except Exception as e:
+                logger.error(f"Failed to publish telemetry: {e}")
+                self.messages_dropped += 1
+                return False
+
+    def close(self):
+        """Close the PUB socket."""
+        with self.lock:
+            self.pub.close()
+        logger.info("Telemetry publisher closed")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get publisher statistics."""
+        return {
+            'port': self.port,
+            'messages_published': self.messages_published,
+            'messages_dropped': self.messages_dropped
+        }
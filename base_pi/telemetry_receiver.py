@@ -12,12 +12,10 @@ import json
 import time
 import logging
 import threading
-import os
-import sys
 from typing import Optional, Dict, Any, Callable
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from common.framing import SecureFramer, FramingError, AuthenticationError, ReplayError
+from common.json_codec import loads_bytes
+from common.framing import SecureFramer, FrameReader, FramingError, AuthenticationError, ReplayError
 from common.constants import MAX_CONTROL_BUFFER
 
 logger = logging.getLogger(__name__)
@@ -32,6 +30,7 @@ class TelemetryReceiver:
         self.on_telemetry = on_telemetry
 
         self.framer = SecureFramer(role="base_pi_telemetry_rx")
+        self.reader: Optional[FrameReader] = None
 
         self.server_socket: Optional[socket.socket] = None
         self.client_socket: Optional[socket.socket] = None
@@ -103,8 +102,9 @@ class TelemetryReceiver:
                         self.client_socket, addr = self.server_socket.accept()
                         self.client_socket.settimeout(5.0)
                         self.connected = True
-                        # Reset framer sequence for new connection
+                        # Reset framer sequence (and read buffer) for new connection
                         self.framer = SecureFramer(role="base_pi_telemetry_rx")
+                        self.reader = FrameReader(self.framer, self.client_socket)
                         logger.info(f"Robot Pi telemetry connected from {addr}")
                     except socket.timeout:
                         continue
@@ -113,11 +113,9 @@ class TelemetryReceiver:
                         time.sleep(1.0)
                         continue
 
-                # Receive authenticated frame
+                # Receive authenticated frame (one recv can yield several)
                 try:
-                    payload, seq = self.framer.read_frame_from_socket(
-                        self.client_socket, timeout=5.0
-                    )
+                    payload, seq = self.reader.read_frame()
                     self._process_telemetry(payload, seq)
 
                 except socket.timeout:
@@ -160,8 +158,7 @@ class TelemetryReceiver:
     def _process_telemetry(self, payload: bytes, seq: int):
         """Process received telemetry frame"""
         try:
-            message = payload.decode('utf-8')
-            telemetry = json.loads(message)
+            telemetry = loads_bytes(payload)
         except UnicodeDecodeError as e:
             logger.error(f"Telemetry decode error: {e}")
             self.decode_errors += 1
@@ -171,7 +168,7 @@ class TelemetryReceiver:
             self.decode_errors += 1
             return
 
-        self.last_telemetry_time = time.time()
+        self.last_telemetry_time = time.monotonic()
         self.messages_received += 1
 
         # Call callback if provided
@@ -188,7 +185,7 @@ class TelemetryReceiver:
         return self.connected
 
     def get_last_telemetry_time(self) -> float:
-        """Get timestamp of last received telemetry"""
+        """Get time.monotonic() of last received telemetry (0 = none yet)"""
         return self.last_telemetry_time
 
     def get_stats(self) -> dict:
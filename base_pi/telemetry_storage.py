@@ -11,12 +11,42 @@ import os
 import time
 import threading
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from queue import Queue, Empty
+from typing import Dict, List, Optional, Any, Tuple
+from queue import Queue, Empty, Full
 
 
 logger = logging.getLogger(__name__)
 
+# Samples are written in batches of up to WRITE_BATCH_MAX, one transaction
+# (and one commit/fsync) per batch; a batch is flushed at the latest
+# WRITE_BATCH_LINGER_S after its first sample arrived
+WRITE_BATCH_MAX = 64
+WRITE_BATCH_LINGER_S = 0.1
+
+_INSERT_SQL = """
+    INSERT INTO telemetry (
+        timestamp, voltage, height, force,
+        imu_quat_w, imu_quat_x, imu_quat_y, imu_quat_z,
+        imu_accel_x, imu_accel_y, imu_accel_z,
+        imu_gyro_x, imu_gyro_y, imu_gyro_z,
+        baro_pressure, baro_temperature, baro_altitude,
+        motor_0_current, motor_1_current, motor_2_current, motor_3_current,
+        motor_4_current, motor_5_current, motor_6_current, motor_7_current,
+        estop_engaged, control_age_ms, rtt_ms, control_seq,
+        robot_cpu_usage, robot_cpu_temp, base_cpu_usage, base_cpu_temp
+    ) VALUES (
+        ?, ?, ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?,
+        ?, ?, ?,
+        ?, ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?, ?
+    )
+"""
+
 
 class TelemetryStorage:
     """
@@ -41,6 +71,10 @@ class TelemetryStorage:
         self.db_conn: Optional[sqlite3.Connection] = None
         self.current_db_date: Optional[str] = None
 
+        # Statistics
+        self.samples_written = 0
+        self.samples_dropped = 0
+
         # Create base directory
         os.makedirs(base_path, exist_ok=True)
 
@@ -73,25 +107,57 @@ class TelemetryStorage:
         """
         try:
             self.write_queue.put_nowait(telemetry)
-        except:
+        except Full:
             # Queue full, drop sample (prefer real-time over storage)
-            pass
+            self.samples_dropped += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get storage statistics."""
+        return {
+            'samples_written': self.samples_written,
+            'samples_dropped': self.samples_dropped,
+            'queue_depth': self.write_queue.qsize()
+        }
+
+    def _next_batch(self) -> List[Dict[str, Any]]:
+        """
+        Collect the next batch of queued samples.
+
+        Blocks up to 1s for the first sample, then takes more until the batch
+        is full or WRITE_BATCH_LINGER_S has passed.
+
+        Returns:
+            Telemetry samples, oldest first (empty on timeout)
+        """
+        try:
+            batch = [self.write_queue.get(timeout=1.0)]
+        except Empty:
+            return []
+
+        deadline = time.monotonic() + WRITE_BATCH_LINGER_S
+        while len(batch) < WRITE_BATCH_MAX:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.write_queue.get(timeout=remaining))
+            except Empty:
+                break
+        return batch
 
     def _writer_loop(self):
-        """Background writer loop (processes write queue)."""
+        """Background writer loop (processes write queue in batches)."""
         while self.running:
             try:
-                # Get telemetry from queue (with timeout)
-                try:
-                    telemetry = self.write_queue.get(timeout=1.0)
-                except Empty:
+                batch = self._next_batch()
+                if not batch:
                     continue
 
                 # Rotate database if needed (new day)
                 self._rotate_database_if_needed()
 
                 # Write to database
-                self._write_to_db(telemetry)
+                self._write_batch(batch)
 
                 # Periodic cleanup (every 100 writes)
                 if self.write_queue.qsize() == 0:
@@ -188,99 +254,95 @@ class TelemetryStorage:
 
         self.db_conn.commit()
 
-    def _write_to_db(self, telemetry: Dict[str, Any]):
+    @staticmethod
+    def _row(telemetry: Dict[str, Any]) -> Tuple:
         """
-        Write telemetry sample to database.
+        Flatten a telemetry sample into an INSERT parameter tuple.
 
         Args:
             telemetry: Telemetry dictionary
+
+        Returns:
+            Column values in _INSERT_SQL order
+        """
+        # Extract values
+        timestamp = telemetry.get('timestamp', time.time())
+        voltage = telemetry.get('voltage')
+        height = telemetry.get('height')
+        force = telemetry.get('force')
+
+        # IMU data
+        imu = telemetry.get('imu', {})
+        imu_quat_w = imu.get('quat_w')
+        imu_quat_x = imu.get('quat_x')
+        imu_quat_y = imu.get('quat_y')
+        imu_quat_z = imu.get('quat_z')
+        imu_accel_x = imu.get('accel_x')
+        imu_accel_y = imu.get('accel_y')
+        imu_accel_z = imu.get('accel_z')
+        imu_gyro_x = imu.get('gyro_x')
+        imu_gyro_y = imu.get('gyro_y')
+        imu_gyro_z = imu.get('gyro_z')
+
+        # Barometer data
+        baro = telemetry.get('barometer', {})
+        baro_pressure = baro.get('pressure')
+        baro_temperature = baro.get('temperature')
+        baro_altitude = baro.get('altitude')
+
+        # Motor currents (8 motors)
+        motor_currents = telemetry.get('motor_currents', [0] * 8)
+        motor_currents = (motor_currents + [0] * 8)[:8]  # Ensure 8 values
+
+        # Status
+        estop = telemetry.get('estop', {})
+        estop_engaged = 1 if estop.get('engaged', False) else 0
+        control_age_ms = telemetry.get('control_age_ms')
+        rtt_ms = telemetry.get('rtt_ms')
+        control_seq = telemetry.get('control_seq')
+
+        # CPU stats
+        robot_cpu = telemetry.get('robot_cpu', {})
+        base_cpu = telemetry.get('base_cpu', {})
+        robot_cpu_usage = robot_cpu.get('usage_percent')
+        robot_cpu_temp = robot_cpu.get('temp_c')
+        base_cpu_usage = base_cpu.get('usage_percent')
+        base_cpu_temp = base_cpu.get('temp_c')
+
+        return (
+            timestamp, voltage, height, force,
+            imu_quat_w, imu_quat_x, imu_quat_y, imu_quat_z,
+            imu_accel_x, imu_accel_y, imu_accel_z,
+            imu_gyro_x, imu_gyro_y, imu_gyro_z,
+            baro_pressure, baro_temperature, baro_altitude,
+            motor_currents[0], motor_currents[1], motor_currents[2], motor_currents[3],
+            motor_currents[4], motor_currents[5], motor_currents[6], motor_currents[7],
+            estop_engaged, control_age_ms, rtt_ms, control_seq,
+            robot_cpu_usage, robot_cpu_temp, base_cpu_usage, base_cpu_temp
+        )
+
+    def _write_batch(self, batch: List[Dict[str, Any]]):
+        """
+        Write telemetry samples to the database in one transaction.
+
+        Args:
+            batch: Telemetry dictionaries, oldest first
         """
         if not self.db_conn:
             return
 
+        rows = []
+        for telemetry in batch:
+            try:
+                rows.append(self._row(telemetry))
+            except Exception as e:
+                # A malformed sample must not cost the rest of the batch
+                logger.error(f"Error preparing telemetry row: {e}")
+
         try:
-            cursor = self.db_conn.cursor()
-
-            # Extract values
-            timestamp = telemetry.get('timestamp', time.time())
-            voltage = telemetry.get('voltage')
-            height = telemetry.get('height')
-            force = telemetry.get('force')
-
-            # IMU data
-            imu = telemetry.get('imu', {})
-            imu_quat_w = imu.get('quat_w')
-            imu_quat_x = imu.get('quat_x')
-            imu_quat_y = imu.get('quat_y')
-            imu_quat_z = imu.get('quat_z')
-            imu_accel_x = imu.get('accel_x')
-            imu_accel_y = imu.get('accel_y')
-            imu_accel_z = imu.get('accel_z')
-            imu_gyro_x = imu.get('gyro_x')
-            imu_gyro_y = imu.get('gyro_y')
-            imu_gyro_z = imu.get('gyro_z')
-
-            # Barometer data
-            baro = telemetry.get('barometer', {})
-            baro_pressure = baro.get('pressure')
-            baro_temperature = baro.get('temperature')
-            baro_altitude = baro.get('altitude')
-
-            # Motor currents (8 motors)
-            motor_currents = telemetry.get('motor_currents', [0] * 8)
-            motor_currents = (motor_currents + [0] * 8)[:8]  # Ensure 8 values
-
-            # Status
-            estop = telemetry.get('estop', {})
-            estop_engaged = 1 if estop.get('engaged', False) else 0
-            control_age_ms = telemetry.get('control_age_ms')
-            rtt_ms = telemetry.get('rtt_ms')
-            control_seq = telemetry.get('control_seq')
-
-            # CPU stats
-            robot_cpu = telemetry.get('robot_cpu', {})
-            base_cpu = telemetry.get('base_cpu', {})
-            robot_cpu_usage = robot_cpu.get('usage_percent')
-            robot_cpu_temp = robot_cpu.get('temp_c')
-            base_cpu_usage = base_cpu.get('usage_percent')
-            base_cpu_temp = base_cpu.get('temp_c')
-
-            # Insert into database
-            cursor.execute("""
-                INSERT INTO telemetry (
-                    timestamp, voltage, height, force,
-                    imu_quat_w, imu_quat_x, imu_quat_y, imu_quat_z,
-                    imu_accel_x, imu_accel_y, imu_accel_z,
-                    imu_gyro_x, imu_gyro_y, imu_gyro_z,
-                    baro_pressure, baro_temperature, baro_altitude,
-                    motor_0_current, motor_1_current, motor_2_current, motor_3_current,
-                    motor_4_current, motor_5_current, motor_6_current, motor_7_current,
-                    estop_engaged, control_age_ms, rtt_ms, control_seq,
-                    robot_cpu_usage, robot_cpu_temp, base_cpu_usage, base_cpu_temp
-                ) VALUES (
-                    ?, ?, ?, ?,
-                    ?, ?, ?, ?,
-                    ?, ?, ?,
-                    ?, ?, ?,
-                    ?, ?, ?,
-                    ?, ?, ?, ?,
-                    ?, ?, ?, ?,
-                    ?, ?, ?, ?,
-                    ?, ?, ?, ?
-                )
-            """, (
-                timestamp, voltage, height, force,
-                imu_quat_w, imu_quat_x, imu_quat_y, imu_quat_z,
-                imu_accel_x, imu_accel_y, imu_accel_z,
-                imu_gyro_x, imu_gyro_y, imu_gyro_z,
-                baro_pressure, baro_temperature, baro_altitude,
-                motor_currents[0], motor_currents[1], motor_currents[2], motor_currents[3],
-                motor_currents[4], motor_currents[5], motor_currents[6], motor_currents[7],
-                estop_engaged, control_age_ms, rtt_ms, control_seq,
-                robot_cpu_usage, robot_cpu_temp, base_cpu_usage, base_cpu_temp
-            ))
-
-            self.db_conn.commit()
+            with self.db_conn:
+                self.db_conn.executemany(_INSERT_SQL, rows)
+            self.samples_written += len(rows)
 
         except Exception as e:
             logger.error(f"Error writing to database: {e}")
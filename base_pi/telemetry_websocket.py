@@ -5,7 +5,6 @@ Real-time telemetry streaming to web clients via WebSocket.
 """
 
 import asyncio
-import json
 import logging
 import threading
 from typing import Set, Optional
@@ -14,10 +13,15 @@ from websockets.server import WebSocketServerProtocol
 
 from base_pi.telemetry_buffer import TelemetryBuffer
 from base_pi.telemetry_metrics import add_derived_metrics
+from common.json_codec import dumps_bytes
 
 
 logger = logging.getLogger(__name__)
 
+# Broadcasts waiting for the event loop; when full the oldest is dropped
+# (a dashboard wants the newest telemetry, not a backlog)
+BROADCAST_QUEUE_MAX = 16
+
 
 class TelemetryWebSocketServer:
     """
@@ -41,10 +45,17 @@ class TelemetryWebSocketServer:
         self.server = None
         self.loop = None
 
+        # Created on the server's event loop in start()
+        self.broadcast_queue: Optional[asyncio.Queue] = None
+        self._broadcast_task: Optional[asyncio.Task] = None
+        self.broadcasts_dropped = 0
+
     async def start(self):
         """Start the WebSocket server."""
-        self.running = True
         self.loop = asyncio.get_event_loop()
+        self.broadcast_queue = asyncio.Queue(maxsize=BROADCAST_QUEUE_MAX)
+        self._broadcast_task = asyncio.ensure_future(self._broadcast_loop())
+        self.running = True
 
         try:
             self.server = await websockets.serve(
@@ -79,10 +90,9 @@ class TelemetryWebSocketServer:
         try:
             # Send latest telemetry immediately on connect
             if self.buffer:
-                latest = self.buffer.get_latest()
+                latest = self.buffer.get_latest_json()
                 if latest:
-                    enhanced = add_derived_metrics(latest)
-                    await websocket.send(json.dumps(enhanced))
+                    await websocket.send(latest.decode('utf-8'))
 
             # Wait for messages (mainly to detect disconnection)
             async for message in websocket:
@@ -97,53 +107,79 @@ class TelemetryWebSocketServer:
             # Unregister client
             self.clients.discard(websocket)
 
-    async def broadcast_telemetry(self, telemetry: dict):
+    async def broadcast_message(self, message: str):
         """
-        Broadcast telemetry to all connected clients.
+        Broadcast an already-encoded telemetry message to all connected clients.
 
         Args:
-            telemetry: Telemetry dictionary to broadcast
+            message: JSON text of the telemetry (with derived metrics)
         """
-        if not self.clients:
-            return
-
-        # Add derived metrics
-        enhanced = add_derived_metrics(telemetry)
-        message = json.dumps(enhanced)
+        # Send to all clients concurrently: one slow client does not delay the rest
+        clients = list(self.clients)
+        results = await asyncio.gather(
+            *[client.send(message) for client in clients],
+            return_exceptions=True
+        )
 
-        # Broadcast to all clients
-        disconnected_clients = set()
-        for client in self.clients:
+        # Remove disconnected clients
+        for client, result in zip(clients, results):
+            if isinstance(result, Exception):
+                if not isinstance(result, websockets.exceptions.ConnectionClosed):
+                    logger.error(f"Error broadcasting to client: {result}")
+                self.clients.discard(client)
+
+    async def _broadcast_loop(self):
+        """Send queued broadcasts to the connected clients, one at a time."""
+        while True:
+            body = await self.broadcast_queue.get()
             try:
-                await client.send(message)
-            except websockets.exceptions.ConnectionClosed:
-                disconnected_clients.add(client)
+                await self.broadcast_message(body.decode('utf-8'))
             except Exception as e:
-                logger.error(f"Error broadcasting to client: {e}")
-                disconnected_clients.add(client)
+                logger.error(f"WebSocket broadcast error: {e}")
 
-        # Remove disconnected clients
-        self.clients -= disconnected_clients
+    def _enqueue_broadcast(self, body: bytes):
+        """Queue a broadcast, dropping the oldest if full (event loop thread only)."""
+        if self.broadcast_queue.full():
+            self.broadcast_queue.get_nowait()
+            self.broadcasts_dropped += 1
+        self.broadcast_queue.put_nowait(body)
 
     def broadcast_telemetry_sync(self, telemetry: dict):
         """
-        Synchronous wrapper for broadcast_telemetry.
+        Synchronous broadcast of a telemetry dictionary.
 
-        Schedules the broadcast on the event loop.
+        Adds derived metrics, encodes in the calling thread and hands the
+        result to broadcast_encoded_sync().
 
         Args:
             telemetry: Telemetry dictionary to broadcast
         """
-        if self.loop and self.running:
-            asyncio.run_coroutine_threadsafe(
-                self.broadcast_telemetry(telemetry),
-                self.loop
-            )
+        if self.loop and self.running and self.clients:
+            self.broadcast_encoded_sync(dumps_bytes(add_derived_metrics(telemetry)))
+
+    def broadcast_encoded_sync(self, body: bytes):
+        """
+        Synchronous broadcast of pre-encoded telemetry JSON.
+
+        Lets the caller reuse an encoding it already has (e.g.
+        TelemetryBuffer.get_latest_json()) instead of encoding again on the
+        event loop. The body is handed to the loop's bounded broadcast queue
+        with call_soon_threadsafe (no coroutine or future per sample), and
+        nothing is scheduled when no client is connected.
+
+        Args:
+            body: JSON bytes of the telemetry (with derived metrics)
+        """
+        if self.loop and self.running and self.clients:
+            self.loop.call_soon_threadsafe(self._enqueue_broadcast, body)
 
     async def stop(self):
         """Stop the WebSocket server."""
         self.running = False
 
+        if self._broadcast_task:
+            self._broadcast_task.cancel()
+
         # Close all client connections
         if self.clients:
             await asyncio.gather(
@@ -14,32 +14,95 @@ Endpoints:
 - /api/telemetry/stats: Telemetry statistics JSON
 """
 
+import hashlib
 import logging
-import time
 import json
 import os
+import selectors
+import socket
+import time
 from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
-from functools import partial
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from urllib.parse import urlparse, parse_qs
 
-from base_pi.telemetry_metrics import add_derived_metrics
+from common.json_codec import dumps_bytes
 
 logger = logging.getLogger(__name__)
 
+# Per-part header of the MJPEG multipart stream (% frame length)
+MJPEG_PART_HEADER = b'--frame\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n'
+
+# /health body up to the frame count, indexed by video connected; only the
+# count changes between requests
+_HEALTH_BODY_HEAD = tuple(
+    json.dumps({
+        'status': 'ok' if connected else 'degraded',
+        'video_connected': connected,
+        'frames_received': 0
+    }).encode()[:-2]
+    for connected in (False, True)
+)
+
+# Kernel send buffer for MJPEG clients: room for about one frame in flight, so
+# a slow client blocks in send (and then skips to the newest frame) instead of
+# queueing seconds of stale video in an autotuned buffer
+MJPEG_SEND_BUFFER = 128 * 1024
+
+# A client whose socket accepts no data for this long is considered stuck and
+# is disconnected (its thread and frame reference are released)
+MJPEG_SEND_TIMEOUT_S = 5.0
+
+# Idle keep-alive connections are closed after this long without a request
+KEEPALIVE_TIMEOUT_S = 5.0
+
+_NO_TELEMETRY_BODY = json.dumps({'error': 'No telemetry data'}).encode()
+
+# Fixed part of every 200 JSON API response; only Date and Content-Length
+# are filled in per request (% (date, length))
+_JSON_RESPONSE_HEAD = (
+    'HTTP/1.1 200 OK\r\n'
+    'Server: %s %s\r\n'
+    'Content-Type: application/json\r\n'
+    'Access-Control-Allow-Origin: *\r\n'
+    % (BaseHTTPRequestHandler.server_version, BaseHTTPRequestHandler.sys_version)
+).encode('latin-1') + b'Date: %s\r\nContent-Length: %d\r\n\r\n'
+
+# base_pi/ and its static/ directory; only files under static/ are served
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_STATIC_DIR = os.path.realpath(os.path.join(_BASE_DIR, 'static'))
+
+# Dashboard assets by full path: (mtime_ns, size, etag, content). Shared by
+# all handler threads; an entry is replaced whole when the file changes.
+_static_cache: Dict[str, Tuple[int, int, str, bytes]] = {}
+
+
+def _load_static(full_path: str) -> Tuple[int, int, str, bytes]:
+    """Return the cache entry for full_path, re-reading it only if it changed on disk."""
+    st = os.stat(full_path)
+    entry = _static_cache.get(full_path)
+    if entry is None or entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+        with open(full_path, 'rb') as f:
+            content = f.read()
+        etag = '"%s"' % hashlib.blake2b(content, digest_size=8).hexdigest()
+        entry = (st.st_mtime_ns, st.st_size, etag, content)
+        _static_cache[full_path] = entry
+    return entry
+
 
 class VideoHTTPHandler(BaseHTTPRequestHandler):
     """
     HTTP handler for MJPEG video streaming and telemetry API.
 
     Serves video frames from the VideoReceiver as an MJPEG stream.
-    Also serves dashboard and telemetry API endpoints.
+    Also serves dashboard and telemetry API endpoints. The receiver and
+    telemetry buffer are read from the server instance (self.server).
+
+    Speaks HTTP/1.1 so dashboard polls reuse one connection; every response
+    except the endless MJPEG stream carries a Content-Length.
     """
 
-    def __init__(self, video_receiver, telemetry_buffer, *args, **kwargs):
-        self.video_receiver = video_receiver
-        self.telemetry_buffer = telemetry_buffer
-        super().__init__(*args, **kwargs)
+    protocol_version = 'HTTP/1.1'
+    timeout = KEEPALIVE_TIMEOUT_S
 
     def log_message(self, format, *args):
         """Suppress default HTTP logging (too verbose)."""
@@ -71,45 +134,112 @@ class VideoHTTPHandler(BaseHTTPRequestHandler):
 
     def _serve_mjpeg_stream(self):
         """Serve MJPEG stream (multipart/x-mixed-replace)."""
-        if not self.video_receiver:
+        if not self.server.video_receiver:
             self.send_error(503, 'Video receiver not available')
             return
 
+        # The stream only ends when the connection does
+        self.close_connection = True
+
         self.send_response(200)
         self.send_header('Content-Type', 'multipart/x-mixed-replace; boundary=frame')
+        self.send_header('Connection', 'close')
         self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
         self.send_header('Pragma', 'no-cache')
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
 
         try:
-            last_frame_time = 0
-            while True:
-                # Only send if we have a new frame (check timestamp)
-                current_time = self.video_receiver.last_frame_time
-                if current_time > last_frame_time:
-                    frame = self.video_receiver.get_frame()
-                    if frame:
-                        self.wfile.write(b'--frame\r\n')
-                        self.wfile.write(b'Content-Type: image/jpeg\r\n')
-                        self.wfile.write(f'Content-Length: {len(frame)}\r\n'.encode())
-                        self.wfile.write(b'\r\n')
-                        self.wfile.write(frame)
-                        self.wfile.write(b'\r\n')
-                        last_frame_time = current_time
-                else:
-                    # Wait briefly for new frame (10ms = 100 FPS max check rate)
-                    time.sleep(0.01)
-        except (BrokenPipeError, ConnectionResetError):
-            pass  # Client disconnected
+            self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, MJPEG_SEND_BUFFER)
+            # The tail of each frame goes out immediately instead of waiting
+            # behind Nagle for the ACK of the previous segment
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as e:
+            logger.debug(f"Could not set MJPEG socket options: {e}")
+        self.connection.settimeout(MJPEG_SEND_TIMEOUT_S)
+
+        last_seq = 0
+        frames_skipped = 0
+        # When the socket was first seen unwritable (None while it accepts data);
+        # a gap in the video source does not count as a stalled client
+        unwritable_since = None
+        with selectors.DefaultSelector() as writable:
+            writable.register(self.connection, selectors.EVENT_WRITE)
+            try:
+                while True:
+                    # Block until the receiver has a frame we haven't sent yet. This
+                    # always returns the newest frame: any that arrived while the
+                    # previous send was blocked on a slow client are skipped.
+                    seq, frame = self.server.video_receiver.wait_for_frame(last_seq, timeout=1.0)
+                    if seq == last_seq:
+                        continue
+                    if last_seq:
+                        frames_skipped += seq - last_seq - 1
+                    last_seq = seq
+
+                    # Client still draining the previous frame: drop this one
+                    # rather than block (nothing of it is written yet)
+                    if not writable.select(timeout=0):
+                        frames_skipped += 1
+                        now = time.monotonic()
+                        if unwritable_since is None:
+                            unwritable_since = now
+                        elif now - unwritable_since > MJPEG_SEND_TIMEOUT_S:
+                            raise socket.timeout("client not reading")
+                        continue
+                    unwritable_since = None
+                    self._send_buffers((MJPEG_PART_HEADER % len(frame), frame, b'\r\n'))
+            except (BrokenPipeError, ConnectionResetError):
+                # Client disconnected
+                logger.debug(f"MJPEG client {self.client_address[0]} disconnected "
+                             f"(skipped {frames_skipped} frames)")
+            except socket.timeout:
+                logger.info(f"MJPEG client {self.client_address[0]} stalled for "
+                            f"{MJPEG_SEND_TIMEOUT_S}s, disconnecting")
+                self.close_connection = True
+
+    def _send_json(self, body: bytes):
+        """
+        Send a 200 JSON response: prebuilt headers and body in one send.
+
+        Bypasses send_response()/send_header(), which format and buffer each
+        header line separately and write the body with a second call.
+        """
+        head = _JSON_RESPONSE_HEAD % (self.date_time_string().encode('latin-1'), len(body))
+        self._send_buffers((head, body))
+
+    def _send_buffers(self, buffers):
+        """
+        Write several buffers with one send syscall where possible.
+
+        Uses scatter/gather sendmsg() so the JPEG is not copied into a joined
+        buffer; falls back to a single joined write where sendmsg() is missing.
+        """
+        if not hasattr(self.connection, 'sendmsg'):
+            self.wfile.write(b''.join(buffers))
+            return
+
+        sent = self.connection.sendmsg(buffers)
+        # Short send (e.g. interrupted by a signal): write out the remainder
+        for buf in buffers:
+            if sent >= len(buf):
+                sent -= len(buf)
+                continue
+            self.connection.sendall(memoryview(buf)[sent:])
+            sent = 0
 
     def _serve_single_frame(self):
-        """Serve a single JPEG frame."""
-        if not self.video_receiver:
+        """
+        Serve a single JPEG frame.
+
+        The frame is written straight from the receiver's shared bytes object;
+        wfile is unbuffered here, so the only copy is the kernel's.
+        """
+        if not self.server.video_receiver:
             self.send_error(503, 'Video receiver not available')
             return
 
-        frame = self.video_receiver.get_frame()
+        frame = self.server.video_receiver.get_frame()
         if frame:
             self.send_response(200)
             self.send_header('Content-Type', 'image/jpeg')
@@ -123,43 +253,45 @@ class VideoHTTPHandler(BaseHTTPRequestHandler):
 
     def _serve_health(self):
         """Serve health status."""
-        connected = self.video_receiver.is_connected() if self.video_receiver else False
-        stats = self.video_receiver.get_stats() if self.video_receiver else {}
+        video_receiver = self.server.video_receiver
+        connected = video_receiver.is_connected() if video_receiver else False
+        stats = video_receiver.get_stats() if video_receiver else {}
 
-        health = {
-            'status': 'ok' if connected else 'degraded',
-            'video_connected': connected,
-            'frames_received': stats.get('frames_received', 0)
-        }
-
-        body = json.dumps(health).encode()
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Content-Length', len(body))
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(body)
+        body = _HEALTH_BODY_HEAD[bool(connected)] + b'%d}' % stats.get('frames_received', 0)
+        self._send_json(body)
 
     def _serve_file(self, filepath, content_type):
-        """Serve a static file."""
+        """
+        Serve a static file.
+
+        Files are served from memory (see _load_static) and carry an ETag;
+        browser revalidations that still match get a bodyless 304.
+        """
         try:
-            # Get the base_pi directory
-            script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            full_path = os.path.join(script_dir, filepath)
+            # Resolve against base_pi/ (symlinks and '..' included) and refuse
+            # anything that ends up outside base_pi/static/
+            full_path = os.path.realpath(os.path.join(_BASE_DIR, filepath))
 
             logger.debug(f"Attempting to serve file: {full_path}")
 
-            if not os.path.exists(full_path):
+            if not full_path.startswith(_STATIC_DIR + os.sep) or not os.path.isfile(full_path):
                 logger.error(f"File not found: {full_path}")
                 self.send_error(404, f'File not found: {filepath}')
                 return
 
-            with open(full_path, 'rb') as f:
-                content = f.read()
+            _, _, etag, content = _load_static(full_path)
+
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Cache-Control', 'no-cache')
+                self.end_headers()
+                return
 
             self.send_response(200)
             self.send_header('Content-Type', content_type)
             self.send_header('Content-Length', len(content))
+            self.send_header('ETag', etag)
             self.send_header('Cache-Control', 'no-cache')
             self.end_headers()
             self.wfile.write(content)
@@ -189,28 +321,20 @@ class VideoHTTPHandler(BaseHTTPRequestHandler):
 
     def _serve_telemetry_latest(self):
         """Serve latest telemetry data."""
-        if not self.telemetry_buffer:
+        if not self.server.telemetry_buffer:
             self.send_error(503, 'Telemetry buffer not available')
             return
 
-        latest = self.telemetry_buffer.get_latest()
-        if latest:
-            # Add derived metrics
-            enhanced = add_derived_metrics(latest)
-            body = json.dumps(enhanced).encode()
-        else:
-            body = json.dumps({'error': 'No telemetry data'}).encode()
+        # Encoded (with derived metrics) once per sample by the buffer
+        body = self.server.telemetry_buffer.get_latest_json()
+        if body is None:
+            body = _NO_TELEMETRY_BODY
 
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Content-Length', len(body))
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(body)
+        self._send_json(body)
 
     def _serve_telemetry_history(self):
         """Serve telemetry history."""
-        if not self.telemetry_buffer:
+        if not self.server.telemetry_buffer:
             self.send_error(503, 'Telemetry buffer not available')
             return
 
@@ -218,31 +342,38 @@ class VideoHTTPHandler(BaseHTTPRequestHandler):
         query = parse_qs(urlparse(self.path).query)
         seconds = int(query.get('seconds', [60])[0])
 
-        history = self.telemetry_buffer.get_history(seconds)
-        body = json.dumps(history).encode()
+        body = self.server.telemetry_buffer.get_history_json(seconds)
 
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Content-Length', len(body))
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(body)
+        self._send_json(body)
 
     def _serve_telemetry_stats(self):
         """Serve telemetry statistics."""
-        if not self.telemetry_buffer:
+        if not self.server.telemetry_buffer:
             self.send_error(503, 'Telemetry buffer not available')
             return
 
-        stats = self.telemetry_buffer.get_stats()
-        body = json.dumps(stats).encode()
+        stats = self.server.telemetry_buffer.get_stats()
+        body = dumps_bytes(stats)
 
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Content-Length', len(body))
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(body)
+        self._send_json(body)
+
+
+class _VideoThreadingHTTPServer(ThreadingHTTPServer):
+    """
+    ThreadingHTTPServer with a listen backlog sized for a dashboard.
+
+    Carries the data sources VideoHTTPHandler serves from, so requests need
+    no per-request handler factory.
+    """
+
+    # A dashboard load opens the stream, static files and API polls at once;
+    # the stdlib default backlog of 5 can refuse some of them
+    request_queue_size = 64
+
+    def __init__(self, server_address, handler_class, video_receiver, telemetry_buffer):
+        self.video_receiver = video_receiver
+        self.telemetry_buffer = telemetry_buffer
+        super().__init__(server_address, handler_class)
 
 
 class VideoHTTPServer:
@@ -250,6 +381,11 @@ class VideoHTTPServer:
     Video HTTP server manager.
 
     Manages HTTP server lifecycle for video streaming and API endpoints.
+
+    Threading model: ThreadingHTTPServer runs one thread per connection.
+    MJPEG stream threads sleep on the VideoReceiver frame condition between
+    frames and hold no CPU or GIL while idle, so the cost of a viewer is
+    one parked thread plus one send per frame.
     """
 
     def __init__(self, port: int, video_receiver, telemetry_buffer):
@@ -271,10 +407,10 @@ class VideoHTTPServer:
     def start(self):
         """Start the HTTP server."""
         try:
-            # Create handler with video_receiver and telemetry_buffer bound
-            handler = partial(VideoHTTPHandler, self.video_receiver, self.telemetry_buffer)
-
-            self.server = ThreadingHTTPServer(('0.0.0.0', self.port), handler)
+            self.server = _VideoThreadingHTTPServer(
+                ('0.0.0.0', self.port), VideoHTTPHandler,
+                self.video_receiver, self.telemetry_buffer
+            )
             logger.info(f"Video HTTP server started on port {self.port}")
             logger.info(f"  MJPEG stream: http://localhost:{self.port}/video")
             logger.info(f"  Single frame: http://localhost:{self.port}/frame")
@@ -13,15 +13,15 @@ import socket
 import logging
 import threading
 import time
-from typing import Optional
-import os
-import sys
+from typing import Optional, Tuple
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from common.constants import MAX_VIDEO_BUFFER
 
 logger = logging.getLogger(__name__)
 
+# Per-part header of an MJPEG multipart stream (% frame length)
+_MJPEG_PART_HEADER = b'--frame\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n'
+
 
 class VideoReceiver:
     """Receives MJPEG video stream from Robot Pi over TCP"""
@@ -35,8 +35,12 @@ class VideoReceiver:
         self.running = False
         self.connected = False
 
-        self.current_frame: Optional[bytes] = None
+        # Latest frame slot: (seq, frame), rebound as a whole so readers need no
+        # lock; every client shares the same immutable bytes object
+        self._latest: Tuple[int, Optional[bytes]] = (0, None)
         self.frame_lock = threading.Lock()
+        # Signalled on every new frame; streaming clients wait on it instead of polling
+        self.frame_cond = threading.Condition(self.frame_lock)
         self.last_frame_time = 0
 
         self.receive_thread: Optional[threading.Thread] = None
@@ -139,7 +143,10 @@ class VideoReceiver:
 
     def _receive_mjpeg_stream(self):
         """Receive and parse MJPEG stream with bounded buffer"""
-        buffer = b""
+        buffer = bytearray()
+        # Where the EOI search resumes: the tail of an incomplete frame has
+        # already been scanned, only bytes from the last recv() are new
+        eoi_from = 0
 
         while self.running and self.connected:
             # Read data
@@ -162,9 +169,10 @@ class VideoReceiver:
                 # Find next SOI marker to resync
                 soi = buffer.find(b'\xff\xd8', MAX_VIDEO_BUFFER // 2)
                 if soi != -1:
-                    buffer = buffer[soi:]
+                    del buffer[:soi]
                 else:
-                    buffer = b""
+                    buffer.clear()
+                eoi_from = 0
                 continue
 
             # Look for JPEG frames (SOI: 0xFFD8, EOI: 0xFFD9)
@@ -173,42 +181,69 @@ class VideoReceiver:
                 if soi == -1:
                     # No SOI, clear buffer up to last few bytes
                     if len(buffer) > 2:
-                        buffer = buffer[-2:]
+                        del buffer[:-2]
+                    eoi_from = 0
                     break
 
-                eoi = buffer.find(b'\xff\xd9', soi + 2)
+                eoi = buffer.find(b'\xff\xd9', max(soi + 2, eoi_from))
                 if eoi == -1:
-                    # Incomplete frame, keep waiting
+                    # Incomplete frame, keep waiting (back up one byte in case
+                    # the marker is split across reads)
+                    eoi_from = len(buffer) - 1
                     break
 
-                # Extract frame
-                frame = buffer[soi:eoi + 2]
-                buffer = buffer[eoi + 2:]
+                # Extract frame (one copy, straight out of the buffer)
+                with memoryview(buffer) as view:
+                    frame = bytes(view[soi:eoi + 2])
+                del buffer[:eoi + 2]
+                eoi_from = 0
+
+                self._publish_frame(frame)
 
-                # Store frame (only keep latest)
-                with self.frame_lock:
-                    self.current_frame = frame
-                    self.last_frame_time = time.time()
-                    self.frames_received += 1
+                logger.debug("Video frame: %d bytes", len(frame))
 
-                logger.debug(f"Video frame: {len(frame)} bytes")
+    def _publish_frame(self, frame: bytes):
+        """Store frame as the latest (only keep latest) and wake waiting clients"""
+        with self.frame_cond:
+            self._latest = (self._latest[0] + 1, frame)
+            self.last_frame_time = time.time()
+            self.frames_received += 1
+            self.frame_cond.notify_all()
 
     def get_frame(self) -> Optional[bytes]:
         """Get the latest video frame"""
-        with self.frame_lock:
-            return self.current_frame
+        return self._latest[1]
+
+    def wait_for_frame(self, last_seq: int, timeout: float = 1.0) -> Tuple[int, Optional[bytes]]:
+        """
+        Wait for a frame newer than last_seq.
+
+        Args:
+            last_seq: Sequence number of the last frame the caller has seen (0 = none)
+            timeout: Max seconds to wait
+
+        Returns:
+            (seq, frame) of the latest frame; seq == last_seq on timeout
+        """
+        # A client that fell behind (the common case while sending) already has
+        # a newer frame waiting: take it from the slot without the lock
+        latest = self._latest
+        if latest[0] != last_seq:
+            return latest
+
+        with self.frame_cond:
+            self.frame_cond.wait_for(lambda: self._latest[0] != last_seq, timeout)
+            return self._latest
 
     def get_frame_generator(self):
         """Generator for streaming frames (for Flask MJPEG endpoint)"""
+        last_seq = 0
         while True:
-            frame = self.get_frame()
-            if frame:
-                yield (b'--frame\r\n'
-                       b'Content-Type: image/jpeg\r\n'
-                       b'Content-Length: ' + str(len(frame)).encode() + b'\r\n'
-                       b'\r\n' + frame + b'\r\n')
-            else:
-                time.sleep(0.1)
+            seq, frame = self.wait_for_frame(last_seq)
+            if seq == last_seq:
+                continue
+            last_seq = seq
+            yield b''.join((_MJPEG_PART_HEADER % len(frame), frame, b'\r\n'))
 
     def is_connected(self) -> bool:
         """Check if Robot Pi video is connected"""
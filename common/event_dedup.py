@@ -0,0 +1,63 @@
+"""
+Event Deduplication
+
+Bounded-memory, time-windowed duplicate suppression for event streams
+(e.g. backend commands replayed after a Socket.IO reconnect).
+
+Fixed-size table indexed by the event fingerprint; each cell remembers the
+last fingerprint that landed there and when. This is the "opposite of a
+bloom filter": it can forget (a colliding event overwrites the cell, so a
+duplicate may get through) but never reports a first-seen event as a
+duplicate, barring a full 64-bit hash collision.
+"""
+
+import time
+from typing import Any, List, Optional, Tuple
+
+from common.json_codec import dumps_bytes
+
+
+class EventDedup:
+    """
+    Drop (name, payload) events repeated within window_s.
+
+    Not thread-safe: call from a single thread (or under the caller's lock).
+    """
+
+    def __init__(self, window_s: float = 0.1, size: int = 512):
+        """
+        Initialize dedup table.
+
+        Args:
+            window_s: Repeats within this many seconds are duplicates
+            size: Number of table cells (rounded up to a power of two)
+        """
+        self.window_s = window_s
+        size = 1 << max(0, size - 1).bit_length()
+        self._mask = size - 1
+        self._cells: List[Optional[Tuple[int, float]]] = [None] * size
+
+        self.duplicates_dropped = 0
+
+    def check(self, name: str, data: Any = None) -> bool:
+        """
+        Record an event and report whether it is new.
+
+        Args:
+            name: Event name
+            data: JSON-serializable payload
+
+        Returns:
+            True if the event is new (deliver it), False if a duplicate
+        """
+        fingerprint = hash((name, dumps_bytes(data)))
+        index = fingerprint & self._mask
+        now = time.monotonic()
+
+        cell = self._cells[index]
+        if cell is not None and cell[0] == fingerprint and now - cell[1] < self.window_s:
+            self.duplicates_dropped += 1
+            return False
+
+        self._cells[index] = (fingerprint, now)
+        return True
@@ -28,6 +28,10 @@ logger = logging.getLogger(__name__)
 
 HEADER_SIZE = 2 + 8 + 32  # length + seq + hmac = 42 bytes
 
+# Prebuilt packers for the frame header (length + seq) and its length field
+_HEADER = struct.Struct('>HQ')
+_LENGTH = struct.Struct('>H')
+
 
 class FramingError(Exception):
     """Base exception for framing errors"""
@@ -68,6 +72,8 @@ class SecureFramer:
         self.role = role
         self.psk: Optional[bytes] = None
         self.psk_valid = False
+        # Keyed HMAC with inner/outer pads precomputed; copied per frame
+        self._hmac_template = None
 
         # Sequence tracking with thread safety
         self._send_seq = 0
@@ -85,6 +91,7 @@ class SecureFramer:
                     self.psk = None
                 else:
                     self.psk_valid = True
+                    self._hmac_template = hmac.new(self.psk, None, hashlib.sha256)
                     logger.info(f"[{role}] PSK loaded successfully")
             except ValueError as e:
                 logger.critical(f"[{role}] Invalid PSK hex: {e}")
@@ -97,6 +104,13 @@ class SecureFramer:
         """Check if PSK is configured and valid"""
         return self.psk_valid and self.psk is not None
 
+    def _compute_mac(self, header: bytes, payload: bytes) -> bytes:
+        """HMAC-SHA256 over header + payload (reuses the keyed template)."""
+        mac = self._hmac_template.copy()
+        mac.update(header)
+        mac.update(payload)
+        return mac.digest()
+
     def create_frame(self, payload: bytes) -> bytes:
         """
         Create an authenticated frame.
@@ -107,6 +121,26 @@ class SecureFramer:
         Returns:
             Complete frame ready to send
 
+        Raises:
+            FrameSizeError: If payload exceeds MAX_FRAME_SIZE
+            AuthenticationError: If PSK not configured
+        """
+        header, payload = self.create_frame_parts(payload)
+        return header + payload
+
+    def create_frame_parts(self, payload: bytes) -> Tuple[bytes, bytes]:
+        """
+        Create an authenticated frame as separate header and payload buffers.
+
+        Same frame as create_frame(), for scatter/gather sends (sendmsg)
+        that avoid concatenating the header and payload.
+
+        Args:
+            payload: Raw payload bytes (typically JSON)
+
+        Returns:
+            Tuple of (header, payload) where header is length + seq + HMAC
+
         Raises:
             FrameSizeError: If payload exceeds MAX_FRAME_SIZE
             AuthenticationError: If PSK not configured
@@ -124,12 +158,12 @@ class SecureFramer:
 
         # Pack header (length + seq)
         length = len(payload)
-        header = struct.pack('>HQ', length, seq)
+        header = _HEADER.pack(length, seq)
 
         # Compute HMAC over header + payload
-        mac = hmac.new(self.psk, header + payload, hashlib.sha256).digest()
+        mac = self._compute_mac(header, payload)
 
-        return header + mac + payload
+        return header + mac, payload
 
     def parse_frame(self, data: bytes) -> Tuple[bytes, int]:
         """
@@ -154,7 +188,7 @@ class SecureFramer:
             raise FramingError(f"Frame too short: {len(data)} < {HEADER_SIZE}")
 
         # Unpack header
-        length, seq = struct.unpack('>HQ', data[:10])
+        length, seq = _HEADER.unpack_from(data)
         received_mac = data[10:42]
 
         # Validate length
@@ -169,7 +203,7 @@ class SecureFramer:
 
         # Verify HMAC
         header = data[:10]
-        expected_mac = hmac.new(self.psk, header + payload, hashlib.sha256).digest()
+        expected_mac = self._compute_mac(header, payload)
 
         if not hmac.compare_digest(received_mac, expected_mac):
             logger.warning(f"[{self.role}] HMAC verification FAILED for seq={seq}")
@@ -203,7 +237,7 @@ class SecureFramer:
 
         # Read header
         header_data = self._recv_exact(sock, HEADER_SIZE)
-        length, seq = struct.unpack('>HQ', header_data[:10])
+        length, seq = _HEADER.unpack_from(header_data)
 
         if length > MAX_FRAME_SIZE:
             raise FrameSizeError(f"Frame length {length} exceeds max {MAX_FRAME_SIZE}")
@@ -216,7 +250,7 @@ class SecureFramer:
             raise AuthenticationError("PSK not configured")
 
         received_mac = header_data[10:42]
-        expected_mac = hmac.new(self.psk, header_data[:10] + payload, hashlib.sha256).digest()
+        expected_mac = self._compute_mac(header_data[:10], payload)
 
         if not hmac.compare_digest(received_mac, expected_mac):
             logger.warning(f"[{self.role}] HMAC verification FAILED for seq={seq}")
@@ -259,6 +293,63 @@ class SecureFramer:
             logger.info(f"[{self.role}] Receive sequence reset: {old_seq} -> 0")
 
 
+class FrameReader:
+    """
+    Buffered frame reader for a stream socket.
+
+    read_frame_from_socket() costs two recv() calls per frame (header, then
+    payload). FrameReader reads whatever the kernel has queued in one recv()
+    and hands out every complete frame in it before reading again, so a
+    burst of frames costs one syscall. Verification is SecureFramer.parse_frame().
+
+    A socket timeout leaves buffered bytes in place: a frame split across the
+    timeout is completed by the next call instead of desyncing the stream.
+    """
+
+    def __init__(self, framer: SecureFramer, sock, recv_size: int = 65536):
+        """
+        Initialize reader.
+
+        Args:
+            framer: Framer that verifies HMAC and sequence numbers
+            sock: Connected stream socket (its timeout applies to each recv)
+            recv_size: Max bytes read per recv() call
+        """
+        self.framer = framer
+        self.sock = sock
+        self.recv_size = recv_size
+        self._buf = bytearray()
+
+    def read_frame(self) -> Tuple[bytes, int]:
+        """
+        Return the next verified frame, reading from the socket only if needed.
+
+        Returns:
+            Tuple of (payload, sequence_number)
+
+        Raises:
+            Various FramingError subclasses on failure
+            ConnectionError if the socket closes
+            socket.timeout if no complete frame arrives within the socket timeout
+        """
+        buf = self._buf
+        while True:
+            if len(buf) >= HEADER_SIZE:
+                length = _LENGTH.unpack_from(buf)[0]
+                if length > MAX_FRAME_SIZE:
+                    raise FrameSizeError(f"Frame length {length} exceeds max {MAX_FRAME_SIZE}")
+                total = HEADER_SIZE + length
+                if len(buf) >= total:
+                    frame = bytes(buf[:total])
+                    del buf[:total]
+                    return self.framer.parse_frame(frame)
+
+            chunk = self.sock.recv(self.recv_size)
+            if not chunk:
+                raise ConnectionError("Socket closed while reading frame")
+            buf += chunk
+
+
 def create_unauthenticated_frame(payload: bytes) -> bytes:
     """
     Create a frame without authentication (for video only).
@@ -270,6 +361,6 @@ def create_unauthenticated_frame(payload: bytes) -> bytes:
         raise FrameSizeError(f"Payload too large: {len(payload)}")
 
     length = len(payload)
-    header = struct.pack('>HQ', length, 0)  # seq=0 for unauthenticated
+    header = _HEADER.pack(length, 0)  # seq=0 for unauthenticated
     mac = b'\x00' * 32  # Zero MAC indicates unauthenticated
     return header + mac + payload
@@ -0,0 +1,57 @@
+"""
+JSON Codec Utilities
+
+Compact JSON encoding to UTF-8 bytes (and decoding from them) for the
+control, telemetry and storage hot paths.
+
+Uses orjson (C extension) when installed and falls back to the stdlib json
+module otherwise. Both produce compact output (no whitespace).
+
+JSONModule is a drop-in for libraries that take a json module with
+stdlib-compatible dumps()/loads() (e.g. python-socketio's json= argument).
+"""
+
+import json
+
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    pass
+
+
+if ORJSON_AVAILABLE:
+    def dumps_bytes(obj) -> bytes:
+        """Serialize obj to compact JSON bytes."""
+        return orjson.dumps(obj)
+
+    def loads_bytes(data: bytes):
+        """Deserialize UTF-8 JSON bytes."""
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which stdlib json.dumps writes for
+            # non-finite floats (robot telemetry); json.JSONDecodeError is
+            # raised from here if the input really is malformed
+            return json.loads(data.decode('utf-8'))
+
+    class JSONModule:
+        """orjson behind the stdlib json dumps()/loads() interface."""
+
+        @staticmethod
+        def dumps(obj, **kwargs) -> str:
+            # Formatting kwargs (separators, indent, ...) are ignored: output is always compact
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+        loads = staticmethod(orjson.loads)
+else:
+    def dumps_bytes(obj) -> bytes:
+        """Serialize obj to compact JSON bytes."""
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def loads_bytes(data: bytes):
+        """Deserialize UTF-8 JSON bytes."""
+        return json.loads(data.decode('utf-8'))
+
+    JSONModule = json
@@ -8,9 +8,34 @@ Created for Phase 1 foundation utilities.
 
 import logging
 import sys
+import time
 from typing import Optional
 
 
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders the %(asctime)s date/time part once per second.
+
+    Output is identical to logging.Formatter; only the time.localtime() +
+    strftime() call is skipped for records in an already-formatted second.
+    """
+
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None, style: str = '%'):
+        super().__init__(fmt, datefmt, style)
+        # (second, formatted head) - one tuple so threads never see a torn pair
+        self._cache = (None, '')
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached_second, head = self._cache
+        if second != cached_second:
+            head = time.strftime(datefmt or self.default_time_format, self.converter(record.created))
+            self._cache = (second, head)
+        if datefmt:
+            return head
+        return self.default_msec_format % (head, record.msecs)
+
+
 def setup_logging(role: str, level: str = "INFO", log_file: Optional[str] = None):
     """
     Configure logging with role-based formatting.
@@ -24,7 +49,7 @@ def setup_logging(role: str, level: str = "INFO", log_file: Optional[str] = None
     numeric_level = getattr(logging, level.upper(), logging.INFO)
 
     # Create formatter with role prefix
-    formatter = logging.Formatter(
+    formatter = CachedTimeFormatter(
         f'%(asctime)s - [{role}] %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
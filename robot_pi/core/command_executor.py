@@ -224,7 +224,7 @@ class CommandExecutor:
         # When we receive a ping, we store it and include pong data in telemetry
         self._last_ping_ts = 0.0      # Timestamp from the ping message
         self._last_ping_seq = 0       # Sequence number from the ping message
-        self._last_ping_received = 0.0  # When we received the ping (local time)
+        self._last_ping_received = 0.0  # When we received the ping (time.monotonic())
         self._ping_lock = threading.Lock()
 
         # Control tracking (for E-STOP clear validation)
@@ -571,7 +571,7 @@ class CommandExecutor:
         with self._ping_lock:
             self._last_ping_ts = ping_ts
             self._last_ping_seq = ping_seq
-            self._last_ping_received = time.time()
+            self._last_ping_received = time.monotonic()
 
         logger.debug(f"Received ping: ts={ping_ts}, seq={ping_seq}")
 
@@ -1089,7 +1089,7 @@ class CommandExecutor:
             Pong data dictionary or None if no recent ping
         """
         with self._ping_lock:
-            ping_age = time.time() - self._last_ping_received
+            ping_age = time.monotonic() - self._last_ping_received
             if self._last_ping_ts > 0 and ping_age < 5.0:
                 return {
                     'ping_ts': self._last_ping_ts,
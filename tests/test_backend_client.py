@@ -0,0 +1,113 @@
+"""
+Tests for Base Pi backend client command dispatch.
+
+Requires python-socketio (skipped otherwise).
+"""
+
+import unittest
+import os
+import sys
+import asyncio
+import threading
+import time
+
+# Add parent to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    from base_pi.core.backend_client import BackendClient
+    BACKEND_CLIENT_AVAILABLE = True
+except ImportError:
+    BACKEND_CLIENT_AVAILABLE = False
+
+
+@unittest.skipUnless(BACKEND_CLIENT_AVAILABLE, "python-socketio not installed")
+class TestCommandDedup(unittest.TestCase):
+    """Command dedup only applies to the replay-prone events, and only when enabled"""
+
+    def tearDown(self):
+        self.client._callback_executor.shutdown()
+        self.client._loop.close()
+
+    def _client(self, **kwargs):
+        self.commands = []
+        self.client = BackendClient(
+            backend_url='http://127.0.0.1:1',
+            on_connection_change=lambda connected: None,
+            on_command=lambda cmd, data: self.commands.append((cmd, data)),
+            on_emergency_status=lambda active, source='test': None,
+            **kwargs
+        )
+        return self.client
+
+    def _fire(self, client, event, data):
+        client.sio.handlers['/'][event](data)
+        # Callbacks run on the worker thread: wait for it to catch up
+        client._callback_executor.submit(lambda: None).result(timeout=5.0)
+
+    def test_disabled_by_default(self):
+        """Without a window, repeated identical commands are all forwarded"""
+        client = self._client()
+        for _ in range(3):
+            self._fire(client, 'clamp_close', {'force': 3})
+        self.assertEqual(len(self.commands), 3)
+
+    def test_replay_prone_event_deduped(self):
+        """With a window, a repeated clamp command is dropped"""
+        client = self._client(command_dedup_window=1.0)
+        self._fire(client, 'clamp_close', {'force': 3})
+        self._fire(client, 'clamp_close', {'force': 3})
+        self.assertEqual(self.commands, [('clamp_close', {'force': 3})])
+
+    def test_other_event_not_deduped(self):
+        """With a window, repeated non-deduped events still go through"""
+        client = self._client(command_dedup_window=1.0)
+        for _ in range(3):
+            self._fire(client, 'raw_button_press', {'button': 'a'})
+            self._fire(client, 'chainsaw_command', {'on': True})
+        self.assertEqual(len(self.commands), 6)
+
+
+
+@unittest.skipUnless(BACKEND_CLIENT_AVAILABLE, "python-socketio not installed")
+class TestCallbackDispatch(unittest.TestCase):
+    """Coordinator callbacks never run on the Socket.IO event loop"""
+
+    def setUp(self):
+        self.release = threading.Event()
+        self.calls = []
+
+        def blocking(*args):
+            self.release.wait(5.0)
+            self.calls.append((threading.current_thread(), args))
+
+        self.client = BackendClient(
+            backend_url='http://127.0.0.1:1',
+            on_connection_change=lambda connected: None,
+            on_command=blocking,
+            on_emergency_status=blocking
+        )
+
+    def tearDown(self):
+        self.release.set()
+        self.client._callback_executor.shutdown()
+        self.client._loop.close()
+
+    def test_blocking_callbacks_do_not_block_handlers(self):
+        """Handlers return while the callback is blocked; callbacks keep order"""
+        handlers = self.client.sio.handlers['/']
+        start = time.monotonic()
+        handlers['clamp_open']({})
+        asyncio.run(handlers['emergency_stop']({'engage': True}))
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(self.calls, [])
+
+        self.release.set()
+        self.client._callback_executor.submit(lambda: None).result(timeout=5.0)
+        self.assertEqual([args for _, args in self.calls],
+                         [('clamp_open', {}), (True, 'emergency_stop')])
+        self.assertIsNot(self.calls[0][0], threading.current_thread())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+"""
+Tests for Base Pi control forwarder.
+
+Tests that commands sent by ControlForwarder arrive at the robot side as
+authenticated, in-order frames with the expected JSON payload.
+"""
+
+import unittest
+import os
+import sys
+import json
+import socket
+import threading
+import time
+
+# Add parent to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from common.framing import SecureFramer
+from base_pi.control_forwarder import ControlForwarder, SEND_TIMEOUT_S
+
+
+# Test PSK (32 bytes = 64 hex chars)
+TEST_PSK = "0123456789abcdef0123456789abcdef0123456789abcdef0123456789abcdef"
+
+
+class TestControlForwarder(unittest.TestCase):
+    """Test ControlForwarder against a local TCP listener"""
+
+    def setUp(self):
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind(('127.0.0.1', 0))
+        self.server.listen(1)
+        self.server.settimeout(5.0)
+        port = self.server.getsockname()[1]
+
+        self.recorded = []
+        self.forwarder = ControlForwarder(
+            robot_ip='127.0.0.1',
+            control_port=port,
+            framer=SecureFramer(psk_hex=TEST_PSK, role="base_pi_test"),
+            on_command_sent=lambda t, d, ok: self.recorded.append((t, d, ok))
+        )
+        self.assertTrue(self.forwarder.connect())
+        self.client, _ = self.server.accept()
+        self.receiver = SecureFramer(psk_hex=TEST_PSK, role="robot_pi_test")
+
+    def tearDown(self):
+        self.forwarder.stop()
+        self.client.close()
+        self.server.close()
+
+    def _read_message(self):
+        payload, seq = self.receiver.read_frame_from_socket(self.client, timeout=5.0)
+        return json.loads(payload.decode('utf-8')), seq
+
+    def test_command_round_trip(self):
+        """Command type and data arrive intact"""
+        self.assertTrue(self.forwarder.send_command('clamp_close', {'force': 3}))
+
+        message, seq = self._read_message()
+        self.assertEqual(message['type'], 'clamp_close')
+        self.assertEqual(message['data'], {'force': 3})
+        self.assertIn('timestamp', message)
+        self.assertEqual(seq, 1)
+        self.assertEqual(self.recorded, [('clamp_close', {'force': 3}, True)])
+
+    def test_last_send_time_tracks_successful_sends(self):
+        """last_send_time moves on success and not on failure"""
+        self.assertEqual(self.forwarder.get_last_send_time(), 0.0)
+        before = time.monotonic()
+        self.assertTrue(self.forwarder.send_command('clamp_open'))
+        sent_at = self.forwarder.get_last_send_time()
+        self.assertGreaterEqual(sent_at, before)
+
+        self.forwarder.disconnect()
+        self.assertFalse(self.forwarder.send_command('clamp_open'))
+        self.assertEqual(self.forwarder.get_last_send_time(), sent_at)
+
+    def test_command_without_data(self):
+        """Commands with no data send an empty data object"""
+        self.assertTrue(self.forwarder.send_command('clamp_open'))
+
+        message, _ = self._read_message()
+        self.assertEqual(message['type'], 'clamp_open')
+        self.assertEqual(message['data'], {})
+        self.assertIsInstance(message['timestamp'], float)
+
+    def test_batch_arrives_as_separate_frames(self):
+        """Batched commands arrive as individual frames in order"""
+        batch = [('input_event', {'i': 0}), ('raw_button_press', None), ('input_event', {'i': 1})]
+        self.assertTrue(self.forwarder.send_commands_batch(batch))
+
+        received = [self._read_message() for _ in range(3)]
+        self.assertEqual([m['type'] for m, _ in received], ['input_event', 'raw_button_press', 'input_event'])
+        self.assertEqual([m['data'] for m, _ in received], [{'i': 0}, {}, {'i': 1}])
+        self.assertEqual([seq for _, seq in received], [1, 2, 3])
+        self.assertEqual(self.forwarder.get_stats()['commands_sent'], 3)
+        self.assertEqual([ok for _, _, ok in self.recorded], [True, True, True])
+
+    def test_repeated_setpoints_encode_by_value_and_type(self):
+        """Memoized setpoint payloads keep bool/int values distinct"""
+        for value in (1, True, 1, [1, 2]):
+            self.assertTrue(self.forwarder.send_command('force_update', {'force': value}))
+
+        received = [self._read_message()[0]['data']['force'] for _ in range(4)]
+        self.assertEqual(received, [1, True, 1, [1, 2]])
+        self.assertIs(received[1], True)
+        self.assertIsNot(received[0], True)
+
+    def test_concurrent_sends_stay_in_order(self):
+        """Frames from several threads arrive whole with increasing seq"""
+        def sender(n):
+            for i in range(50):
+                self.forwarder.send_command('height_update', {'thread': n, 'i': i})
+
+        threads = [threading.Thread(target=sender, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+
+        seqs = [self._read_message()[1] for _ in range(200)]
+        for t in threads:
+            t.join()
+
+        self.assertEqual(seqs, sorted(seqs))
+        self.assertEqual(self.forwarder.get_stats()['commands_sent'], 200)
+
+    def test_stalled_robot_does_not_block_sender(self):
+        """A robot that stops reading makes sends fail within the send timeout"""
+        pad = 'x' * 15000
+        start = time.monotonic()
+        failed = False
+        for _ in range(5000):
+            if not self.forwarder.send_command('height_update', {'pad': pad}):
+                failed = True
+                break
+
+        self.assertTrue(failed)
+        self.assertLess(time.monotonic() - start, SEND_TIMEOUT_S + 2.0)
+        self.assertEqual(self.recorded[-1][2], False)
+
+    def test_send_when_disconnected_fails(self):
+        """Commands are rejected and counted after disconnect"""
+        self.forwarder.disconnect()
+        self.assertFalse(self.forwarder.send_command('clamp_open', {}))
+        self.assertEqual(self.forwarder.get_stats()['commands_failed'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
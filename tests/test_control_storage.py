@@ -0,0 +1,120 @@
+"""
+Tests for Base Pi control command storage.
+
+Tests that queued commands end up as JSONL records on disk.
+"""
+
+import unittest
+import os
+import sys
+import json
+import time
+import tempfile
+import shutil
+import threading
+from unittest import mock
+
+# Add parent to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from base_pi import control_storage
+from base_pi.control_storage import ControlStorage
+
+
+class TestControlStorage(unittest.TestCase):
+    """Test ControlStorage batched JSONL writer"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.storage = ControlStorage(base_path=self.tmpdir)
+
+    def tearDown(self):
+        self.storage.stop()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _read_records(self):
+        records = []
+        for filename in sorted(os.listdir(self.tmpdir)):
+            with open(os.path.join(self.tmpdir, filename), 'r', encoding='utf-8') as f:
+                records.extend(json.loads(line) for line in f if line.strip())
+        return records
+
+    def test_commands_written_on_stop(self):
+        """All queued commands are on disk after stop()"""
+        self.storage.start()
+        for i in range(300):
+            self.storage.write_command('height_update', {'height': i})
+        self.storage.stop()
+
+        records = self._read_records()
+        self.assertEqual(len(records), 300)
+        self.assertEqual(records[0]['type'], 'height_update')
+        self.assertEqual(records[-1]['data'], {'height': 299})
+        self.assertEqual(self.storage.commands_written, 300)
+
+    def test_failed_command_recorded(self):
+        """Success flag is preserved in the record"""
+        self.storage.start()
+        self.storage.write_command('clamp_close', {}, success=False)
+        time.sleep(0.2)
+        self.storage.stop()
+
+        records = self._read_records()
+        self.assertEqual(len(records), 1)
+        self.assertFalse(records[0]['success'])
+
+    def test_file_named_by_day(self):
+        """Records go to commands_YYYYMMDD.jsonl"""
+        self.storage.start()
+        self.storage.write_command('clamp_open', {})
+        self.storage.stop()
+
+        files = os.listdir(self.tmpdir)
+        self.assertEqual(len(files), 1)
+        self.assertTrue(files[0].startswith('commands_'))
+        self.assertTrue(files[0].endswith('.jsonl'))
+        self.assertEqual(len(files[0]), len('commands_YYYYMMDD.jsonl'))
+
+    def test_stop_leaves_busy_writer_to_drain(self):
+        """stop() does not write behind a writer that outlives the join; the writer drains on exit"""
+        release = threading.Event()
+        entered = threading.Event()
+        writer_threads = set()
+        write_batch = self.storage._write_batch
+
+        def slow_write_batch(records):
+            writer_threads.add(threading.current_thread())
+            entered.set()
+            release.wait(5.0)
+            write_batch(records)
+
+        self.storage._write_batch = slow_write_batch
+        self.storage.start()
+        self.storage.write_command('clamp_close', {})
+        self.assertTrue(entered.wait(2.0))
+        self.storage.write_command('clamp_open', {})
+
+        with mock.patch.object(control_storage, 'WRITER_JOIN_TIMEOUT_S', 0.05):
+            self.storage.stop()
+        release.set()
+        self.storage.writer_thread.join(timeout=2.0)
+
+        self.assertEqual(writer_threads, {self.storage.writer_thread})
+        self.assertEqual([r['type'] for r in self._read_records()], ['clamp_close', 'clamp_open'])
+
+    def test_cleanup_removes_only_expired_logs(self):
+        """Retention cleanup deletes old command logs and nothing else"""
+        storage = ControlStorage(base_path=self.tmpdir, retention_days=30)
+        for name in ('commands_20000101.jsonl', 'commands_29990101.jsonl',
+                     'commands_notadate.jsonl', 'telemetry_20000101.db'):
+            open(os.path.join(self.tmpdir, name), 'w').close()
+
+        storage._cleanup_old_files()
+
+        self.assertEqual(sorted(os.listdir(self.tmpdir)), [
+            'commands_29990101.jsonl', 'commands_notadate.jsonl', 'telemetry_20000101.db'
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Tests for time-windowed event deduplication.
+"""
+
+import unittest
+import os
+import sys
+import time
+
+# Add parent to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from common.event_dedup import EventDedup
+
+
+class TestEventDedup(unittest.TestCase):
+    """Test EventDedup window and fingerprinting"""
+
+    def test_repeat_within_window_dropped(self):
+        """Same name and payload inside the window is a duplicate"""
+        dedup = EventDedup(window_s=1.0)
+        self.assertTrue(dedup.check('clamp_close', {'force': 3}))
+        self.assertFalse(dedup.check('clamp_close', {'force': 3}))
+        self.assertEqual(dedup.duplicates_dropped, 1)
+
+    def test_different_payload_or_name_passes(self):
+        """Payload and event name are both part of the fingerprint"""
+        dedup = EventDedup(window_s=1.0)
+        self.assertTrue(dedup.check('height_update', {'height': 1}))
+        self.assertTrue(dedup.check('height_update', {'height': 2}))
+        self.assertTrue(dedup.check('height_update', {'height': True}))
+        self.assertTrue(dedup.check('force_update', {'height': 1}))
+
+    def test_repeat_after_window_passes(self):
+        """Repeats are delivered again once the window has passed"""
+        dedup = EventDedup(window_s=0.05)
+        self.assertTrue(dedup.check('clamp_open'))
+        time.sleep(0.1)
+        self.assertTrue(dedup.check('clamp_open'))
+
+    def test_table_size_is_bounded(self):
+        """Memory stays fixed no matter how many events are seen"""
+        dedup = EventDedup(window_s=1.0, size=500)
+        for i in range(5000):
+            dedup.check('input_event', {'i': i})
+        self.assertEqual(len(dedup._cells), 512)
+
+
+if __name__ == '__main__':
+    unittest.main()
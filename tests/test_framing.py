@@ -7,13 +7,14 @@ Tests HMAC authentication, anti-replay protection, and frame parsing.
 import unittest
 import os
 import sys
+import socket
 import struct
 
 # Add parent to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from common.framing import (
-    SecureFramer, FramingError, AuthenticationError, ReplayError, FrameSizeError,
+    SecureFramer, FrameReader, FramingError, AuthenticationError, ReplayError, FrameSizeError,
     HEADER_SIZE
 )
 from common.constants import MAX_FRAME_SIZE
@@ -240,5 +241,59 @@ class TestFramerEdgeCases(unittest.TestCase):
         self.assertEqual(sender.get_send_seq(), 1)
 
 
+class TestFrameReader(unittest.TestCase):
+    """Test buffered frame reading from a stream socket"""
+
+    def setUp(self):
+        self.sender = SecureFramer(psk_hex=TEST_PSK, role="sender")
+        self.tx, rx = socket.socketpair()
+        rx.settimeout(1.0)
+        self.rx = rx
+        self.reader = FrameReader(SecureFramer(psk_hex=TEST_PSK, role="receiver"), rx)
+
+    def tearDown(self):
+        self.tx.close()
+        self.rx.close()
+
+    def test_burst_in_one_send(self):
+        """Several frames written at once are all returned, in order"""
+        payloads = [b"a", b"", b"c" * 1000]
+        self.tx.sendall(b"".join(self.sender.create_frame(p) for p in payloads))
+
+        received = [self.reader.read_frame() for _ in payloads]
+        self.assertEqual(received, [(b"a", 1), (b"", 2), (b"c" * 1000, 3)])
+
+    def test_frame_split_across_timeout(self):
+        """A partial frame survives a socket timeout and completes later"""
+        frame = self.sender.create_frame(b"split payload")
+        self.tx.sendall(frame[:20])
+        self.rx.settimeout(0.05)
+        with self.assertRaises(socket.timeout):
+            self.reader.read_frame()
+
+        self.tx.sendall(frame[20:])
+        self.assertEqual(self.reader.read_frame(), (b"split payload", 1))
+
+    def test_tampered_frame_rejected(self):
+        """HMAC verification still applies"""
+        frame = bytearray(self.sender.create_frame(b"payload"))
+        frame[-1] ^= 0xFF
+        self.tx.sendall(bytes(frame))
+        with self.assertRaises(AuthenticationError):
+            self.reader.read_frame()
+
+    def test_oversize_length_rejected_before_payload(self):
+        """An oversize length header fails without waiting for the payload"""
+        self.tx.sendall(struct.pack('>HQ', MAX_FRAME_SIZE + 1, 1) + b"\x00" * 32)
+        with self.assertRaises(FrameSizeError):
+            self.reader.read_frame()
+
+    def test_closed_socket(self):
+        """Peer close raises ConnectionError"""
+        self.tx.close()
+        with self.assertRaises(ConnectionError):
+            self.reader.read_frame()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,45 @@
+"""
+Tests for logging configuration utilities.
+"""
+
+import unittest
+import os
+import sys
+import logging
+
+# Add parent to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from common.logging_config import CachedTimeFormatter
+
+
+FMT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+class TestCachedTimeFormatter(unittest.TestCase):
+    """CachedTimeFormatter must render exactly like logging.Formatter"""
+
+    def _record(self, created: float) -> logging.LogRecord:
+        record = logging.LogRecord('test', logging.INFO, __file__, 1, 'msg', None, None)
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+        return record
+
+    def test_matches_stdlib_across_seconds(self):
+        """Same output as stdlib for records within and across seconds"""
+        stdlib = logging.Formatter(FMT)
+        cached = CachedTimeFormatter(FMT)
+        for created in (1700000000.001, 1700000000.999, 1700000001.5, 1700000000.25):
+            record = self._record(created)
+            self.assertEqual(cached.format(record), stdlib.format(record))
+
+    def test_matches_stdlib_with_datefmt(self):
+        """Explicit datefmt is honoured (no milliseconds appended)"""
+        stdlib = logging.Formatter(FMT, datefmt='%Y-%m-%d %H:%M:%S')
+        cached = CachedTimeFormatter(FMT, datefmt='%Y-%m-%d %H:%M:%S')
+        record = self._record(1700000000.5)
+        self.assertEqual(cached.format(record), stdlib.format(record))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Tests for the Base Pi telemetry buffer.
+"""
+
+import unittest
+import os
+import sys
+import json
+
+# Add parent to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from base_pi.telemetry_buffer import TelemetryBuffer
+
+
+class TestLatestJson(unittest.TestCase):
+    """get_latest_json encodes once per sample and tracks new samples"""
+
+    def test_empty_buffer(self):
+        """No samples means no body"""
+        self.assertIsNone(TelemetryBuffer().get_latest_json())
+
+    def test_encoded_once_per_sample(self):
+        """Repeated reads of one sample return the same bytes object"""
+        buffer = TelemetryBuffer()
+        buffer.add_sample({'voltage': 12.1, 'motor_currents': [1.0, 2.0]})
+
+        body = buffer.get_latest_json()
+        self.assertIs(buffer.get_latest_json(), body)
+
+        decoded = json.loads(body)
+        self.assertEqual(decoded['voltage'], 12.1)
+        self.assertEqual(decoded['total_motor_current'], 3.0)
+        self.assertIn('health_score', decoded)
+
+    def test_new_sample_invalidates(self):
+        """A new sample (also after clear) is re-encoded"""
+        buffer = TelemetryBuffer()
+        buffer.add_sample({'voltage': 12.0})
+        buffer.get_latest_json()
+        buffer.add_sample({'voltage': 11.0})
+        self.assertEqual(json.loads(buffer.get_latest_json())['voltage'], 11.0)
+
+        buffer.clear()
+        self.assertIsNone(buffer.get_latest_json())
+        buffer.add_sample({'voltage': 10.0})
+        buffer.add_sample({'voltage': 9.0})
+        self.assertEqual(json.loads(buffer.get_latest_json())['voltage'], 9.0)
+
+
+class TestHistoryJson(unittest.TestCase):
+    """get_history_json matches get_history and caches common windows"""
+
+    def setUp(self):
+        self.buffer = TelemetryBuffer(max_samples=50)
+        for i in range(80):
+            self.buffer.add_sample({'timestamp': float(i)})
+
+    def test_matches_get_history(self):
+        """Same samples as get_history for small, full and oversized windows"""
+        for seconds in (1, 3, 10, 60):
+            self.assertEqual(json.loads(self.buffer.get_history_json(seconds)),
+                             self.buffer.get_history(seconds))
+        self.assertEqual(json.loads(self.buffer.get_history_json(1))[0]['timestamp'], 70.0)
+
+    def test_common_window_cached_until_next_sample(self):
+        """A cached window is reused, then refreshed by a new sample"""
+        body = self.buffer.get_history_json(10)
+        self.assertIs(self.buffer.get_history_json(10), body)
+
+        self.buffer.add_sample({'timestamp': 80.0})
+        self.assertEqual(json.loads(self.buffer.get_history_json(10))[-1]['timestamp'], 80.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
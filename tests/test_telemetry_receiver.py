@@ -0,0 +1,50 @@
+"""
+Tests for Base Pi telemetry receiver frame decoding.
+"""
+
+import unittest
+import json
+import math
+import os
+import sys
+
+# Add parent to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from base_pi.telemetry_receiver import TelemetryReceiver
+
+
+class TestProcessTelemetry(unittest.TestCase):
+    """Test decoding of telemetry payloads"""
+
+    def setUp(self):
+        self.received = []
+        self.receiver = TelemetryReceiver(telemetry_port=0, on_telemetry=self.received.append)
+
+    def test_non_finite_floats_accepted(self):
+        """NaN/Infinity written by the robot's json.dumps do not drop the frame"""
+        payload = json.dumps({
+            'voltage': 12.1,
+            'imu': {'accel_x': float('nan'), 'gyro_z': float('inf')},
+        }).encode('utf-8')
+        self.assertIn(b'NaN', payload)
+
+        self.receiver._process_telemetry(payload, seq=1)
+
+        self.assertEqual(self.receiver.decode_errors, 0)
+        self.assertEqual(self.receiver.messages_received, 1)
+        telemetry = self.received[0]
+        self.assertEqual(telemetry['voltage'], 12.1)
+        self.assertTrue(math.isnan(telemetry['imu']['accel_x']))
+        self.assertEqual(telemetry['imu']['gyro_z'], float('inf'))
+
+    def test_malformed_json_counted(self):
+        """Malformed JSON is counted as a decode error and not delivered"""
+        self.receiver._process_telemetry(b'{"voltage": ', seq=1)
+
+        self.assertEqual(self.receiver.decode_errors, 1)
+        self.assertEqual(self.received, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Tests for Base Pi telemetry storage.
+
+Tests that batched samples end up as rows in the daily SQLite database.
+"""
+
+import unittest
+import os
+import sys
+import sqlite3
+import tempfile
+import shutil
+
+# Add parent to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from base_pi.telemetry_storage import TelemetryStorage, WRITE_BATCH_MAX
+
+
+class TestTelemetryStorage(unittest.TestCase):
+    """Test TelemetryStorage batched SQLite writer"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.storage = TelemetryStorage(base_path=self.tmpdir)
+
+    def tearDown(self):
+        if self.storage.db_conn:
+            self.storage.db_conn.close()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _query(self, sql):
+        path = self.storage._get_db_path(self.storage.current_db_date)
+        with sqlite3.connect(path) as conn:
+            return conn.execute(sql).fetchone()
+
+    def test_batch_collected_and_written(self):
+        """Queued samples are taken in bounded batches and stored as rows"""
+        for i in range(WRITE_BATCH_MAX + 10):
+            self.storage.write_telemetry({
+                'timestamp': float(i),
+                'motor_currents': [1.5, 2.5],
+                'estop': {'engaged': i == 0}
+            })
+
+        batch = self.storage._next_batch()
+        self.assertEqual(len(batch), WRITE_BATCH_MAX)
+
+        self.storage._rotate_database_if_needed()
+        self.storage._write_batch(batch)
+        self.storage._write_batch(self.storage._next_batch())
+
+        self.assertEqual(self._query('SELECT COUNT(*), SUM(estop_engaged) FROM telemetry'),
+                         (WRITE_BATCH_MAX + 10, 1))
+        self.assertEqual(self._query('SELECT motor_1_current, motor_7_current FROM telemetry LIMIT 1'),
+                         (2.5, 0))
+        self.assertEqual(self.storage.samples_written, WRITE_BATCH_MAX + 10)
+
+    def test_malformed_sample_skipped(self):
+        """One bad sample does not drop the rest of its batch"""
+        self.storage._rotate_database_if_needed()
+        self.storage._write_batch([{'timestamp': 1.0}, {'motor_currents': 5}, {'timestamp': 2.0}])
+
+        self.assertEqual(self._query('SELECT COUNT(*) FROM telemetry'), (2,))
+
+
+if __name__ == '__main__':
+    unittest.main()
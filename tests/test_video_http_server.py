@@ -0,0 +1,126 @@
+"""
+Tests for Base Pi video HTTP server MJPEG streaming and static files.
+"""
+
+import unittest
+import os
+import selectors
+import socket
+import sys
+import threading
+import time
+from unittest import mock
+
+# Add parent to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from base_pi.video import video_http_server
+from base_pi.video.video_http_server import VideoHTTPServer
+from base_pi.video_receiver import VideoReceiver
+
+
+_RealSelector = selectors.DefaultSelector
+
+
+class _StallOnceSelector(_RealSelector):
+    """Selector that reports the socket unwritable on the next select after stall_next is set"""
+
+    stall_next = threading.Event()
+
+    def select(self, timeout=None):
+        if self.stall_next.is_set():
+            self.stall_next.clear()
+            return []
+        return super().select(timeout)
+
+
+class TestMJPEGStallDetection(unittest.TestCase):
+    """Test that only a client that stops reading is disconnected"""
+
+    def setUp(self):
+        _StallOnceSelector.stall_next.clear()
+        patches = (
+            mock.patch.object(video_http_server, 'MJPEG_SEND_TIMEOUT_S', 0.3),
+            mock.patch.object(video_http_server.selectors, 'DefaultSelector', _StallOnceSelector),
+        )
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.receiver = VideoReceiver(video_port=0)
+        self.http = VideoHTTPServer(0, self.receiver, None)
+        self.http.start()
+        threading.Thread(target=self.http.serve_forever, daemon=True).start()
+        self.addCleanup(self.http.server.server_close)
+        self.addCleanup(self.http.shutdown)
+
+        port = self.http.server.server_address[1]
+        self.client = socket.create_connection(('127.0.0.1', port), timeout=2.0)
+        self.addCleanup(self.client.close)
+        self.client.sendall(b'GET /video HTTP/1.1\r\nHost: localhost\r\n\r\n')
+        self.received = b''
+
+    def _publish_until_received(self, frame, timeout=2.0):
+        """Publish frame repeatedly until the client has read it; False if it never arrives"""
+        self.client.settimeout(0.05)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            self.receiver._publish_frame(frame)
+            try:
+                data = self.client.recv(65536)
+            except socket.timeout:
+                continue
+            if not data:
+                return False
+            self.received += data
+            if frame in self.received:
+                return True
+        return False
+
+    def test_stream_resumes_after_source_gap(self):
+        """A source gap longer than the send timeout does not disconnect a reading client"""
+        self.assertTrue(self._publish_until_received(b'\xff\xd8first\xff\xd9'))
+
+        # No frames for longer than the timeout, then a momentarily busy socket
+        time.sleep(0.5)
+        _StallOnceSelector.stall_next.set()
+
+        self.assertTrue(self._publish_until_received(b'\xff\xd8resumed\xff\xd9'))
+
+
+class TestStaticFiles(unittest.TestCase):
+    """Test that only files under base_pi/static are served"""
+
+    def setUp(self):
+        self.http = VideoHTTPServer(0, None, None)
+        self.http.start()
+        threading.Thread(target=self.http.serve_forever, daemon=True).start()
+        self.addCleanup(self.http.server.server_close)
+        self.addCleanup(self.http.shutdown)
+
+    def _get(self, path):
+        """Send a raw GET (path not normalized by a client library); return the status line"""
+        port = self.http.server.server_address[1]
+        with socket.create_connection(('127.0.0.1', port), timeout=2.0) as client:
+            client.sendall(b'GET %s HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n'
+                           % path.encode())
+            response = b''
+            while True:
+                data = client.recv(65536)
+                if not data:
+                    break
+                response += data
+        return response.split(b'\r\n', 1)[0]
+
+    def test_dashboard_served(self):
+        """/dashboard serves static/dashboard.html"""
+        self.assertIn(b' 200 ', self._get('/dashboard'))
+
+    def test_traversal_out_of_static_refused(self):
+        """/static/../config.py does not serve base_pi/config.py"""
+        self.assertIn(b' 404 ', self._get('/static/../config.py'))
+        self.assertIn(b' 404 ', self._get('/static/../../common/json_codec.py'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Tests for Base Pi video receiver frame hand-off.
+"""
+
+import unittest
+import os
+import sys
+import socket
+import threading
+import time
+
+# Add parent to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from base_pi.video_receiver import VideoReceiver
+
+
+class TestFrameHandoff(unittest.TestCase):
+    """Test wait_for_frame wake-up and sequencing"""
+
+    def setUp(self):
+        self.receiver = VideoReceiver(video_port=0)
+
+    def test_waiter_wakes_on_new_frame(self):
+        """A waiting client is woken by the next frame, well before the timeout"""
+        timer = threading.Timer(0.05, self.receiver._publish_frame, args=(b'\xff\xd8a\xff\xd9',))
+        timer.start()
+        start = time.monotonic()
+        seq, frame = self.receiver.wait_for_frame(0, timeout=5.0)
+        timer.join()
+
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual((seq, frame), (1, b'\xff\xd8a\xff\xd9'))
+
+    def test_timeout_returns_same_seq(self):
+        """No new frame within the timeout returns the caller's seq"""
+        self.receiver._publish_frame(b'\xff\xd8a\xff\xd9')
+        seq, frame = self.receiver.wait_for_frame(1, timeout=0.05)
+        self.assertEqual(seq, 1)
+        self.assertEqual(frame, b'\xff\xd8a\xff\xd9')
+
+    def test_late_client_gets_latest_frame_immediately(self):
+        """A client behind by several frames gets only the newest one"""
+        for i in range(3):
+            self.receiver._publish_frame(bytes([i]))
+        seq, frame = self.receiver.wait_for_frame(0, timeout=0.0)
+        self.assertEqual((seq, frame), (3, bytes([2])))
+
+
+class TestMJPEGParsing(unittest.TestCase):
+    """Test JPEG frame extraction from the raw TCP stream"""
+
+    def test_frames_split_across_reads(self):
+        """Frames are extracted whole from chunked input with junk between them"""
+        receiver = VideoReceiver(video_port=0, buffer_size=7)
+        robot, receiver.client_socket = socket.socketpair()
+        receiver.running = True
+        receiver.connected = True
+
+        frames = [b'\xff\xd8' + bytes([i]) * (100 + i) + b'\xff\xd9' for i in range(5)]
+        robot.sendall(b'junk' + b'xx'.join(frames))
+        robot.close()
+
+        published = []
+        receiver._publish_frame = published.append
+        receiver._receive_mjpeg_stream()
+        receiver.client_socket.close()
+
+        self.assertEqual(published, frames)
+        self.assertTrue(all(type(f) is bytes for f in published))
+        self.assertFalse(receiver.connected)
+
+
+if __name__ == '__main__':
+    unittest.main()